@@ -48,39 +48,62 @@ class BrandComparisonAnalyzer:
         if df.empty:
             return {}
 
-        # Explode brand list so each row has one brand
-        exploded = df.explode("brands").rename(columns={"brands": "brand"})
+        # Explode brand list so each row has one brand; only the columns read below
+        cols = [
+            c
+            for c in ("brands", "hybrid_score", "vader_score", "score", "subreddit")
+            if c in df.columns
+        ]
+        exploded = df[cols].explode("brands").rename(columns={"brands": "brand"})
         exploded = exploded[exploded["brand"].notna() & (exploded["brand"] != "")]
 
-        metrics: dict[str, BrandMetrics] = {}
-        for brand, group in exploded.groupby("brand"):
-            if len(group) < min_mentions:
-                continue
-            n = len(group)
-            hybrid = group["hybrid_score"].fillna(0.0)
-            vader = group["vader_score"].fillna(0.0)
-            post_score = (
-                group["score"].fillna(0) if "score" in group.columns else pd.Series([0] * n)
-            )
-
-            pos_pct = (hybrid > self.POSITIVE_THRESHOLD).mean() * 100
-            neg_pct = (hybrid < self.NEGATIVE_THRESHOLD).mean() * 100
-            neu_pct = 100 - pos_pct - neg_pct
+        counts = exploded["brand"].value_counts()
+        exploded = exploded[exploded["brand"].isin(counts.index[counts >= min_mentions])]
+        if exploded.empty:
+            return {}
 
-            top_subs = []
-            if "subreddit" in group.columns:
-                top_subs = group["subreddit"].value_counts().head(3).index.tolist()
+        # One grouped pass for every per-brand figure
+        hybrid = exploded["hybrid_score"].fillna(0.0)
+        columns = pd.DataFrame(
+            {
+                "brand": exploded["brand"],
+                "hybrid": hybrid,
+                "vader": exploded["vader_score"].fillna(0.0),
+                "positive": hybrid > self.POSITIVE_THRESHOLD,
+                "negative": hybrid < self.NEGATIVE_THRESHOLD,
+                "post_score": exploded["score"].fillna(0) if "score" in exploded.columns else 0,
+            }
+        )
+        stats = columns.groupby("brand").agg(
+            n=("hybrid", "size"),
+            hybrid=("hybrid", "mean"),
+            vader=("vader", "mean"),
+            positive=("positive", "mean"),
+            negative=("negative", "mean"),
+            post_score=("post_score", "mean"),
+        )
+
+        top_subs: dict[str, list[str]] = {}
+        if "subreddit" in exploded.columns:
+            top_subs = {
+                brand: group.value_counts().head(3).index.tolist()
+                for brand, group in exploded.groupby("brand")["subreddit"]
+            }
 
-            metrics[brand] = BrandMetrics(
-                brand=brand,
-                mention_count=n,
-                avg_hybrid_score=float(hybrid.mean()),
-                avg_vader_score=float(vader.mean()),
+        metrics: dict[str, BrandMetrics] = {}
+        for row in stats.itertuples():
+            pos_pct = row.positive * 100
+            neg_pct = row.negative * 100
+            metrics[row.Index] = BrandMetrics(
+                brand=row.Index,
+                mention_count=int(row.n),
+                avg_hybrid_score=float(row.hybrid),
+                avg_vader_score=float(row.vader),
                 positive_pct=float(pos_pct),
                 negative_pct=float(neg_pct),
-                neutral_pct=float(neu_pct),
-                avg_post_score=float(post_score.mean()),
-                top_subreddits=top_subs,
+                neutral_pct=float(100 - pos_pct - neg_pct),
+                avg_post_score=float(row.post_score),
+                top_subreddits=top_subs.get(row.Index, []),
             )
 
         return metrics
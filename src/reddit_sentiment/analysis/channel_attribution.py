@@ -16,6 +16,11 @@ class ChannelAttribution:
     channel_by_brand: dict[str, dict[str, int]]  # brand → {channel: count}
     intent_funnel: dict[str, int]  # intent → count
     top_channels: list[str] = field(default_factory=list)
+    intent_signals: int | None = None  # rows with a primary intent; defaults to the funnel total
+
+    def __post_init__(self) -> None:
+        if self.intent_signals is None:
+            self.intent_signals = sum(self.intent_funnel.values())
 
 
 class ChannelAttributionAnalyzer:
@@ -58,8 +63,11 @@ class ChannelAttributionAnalyzer:
 
         # Intent funnel
         intent_funnel: dict[str, int] = {}
+        intent_signals = 0
         if "primary_intent" in df.columns:
-            intent_funnel = df["primary_intent"].dropna().value_counts().to_dict()
+            intents = df["primary_intent"].dropna()
+            intent_funnel = intents.value_counts().to_dict()
+            intent_signals = len(intents)
 
         return ChannelAttribution(
             channel_share=channel_share,
@@ -67,4 +75,5 @@ class ChannelAttributionAnalyzer:
             channel_by_brand=channel_by_brand,
             intent_funnel=intent_funnel,
             top_channels=top_channels,
+            intent_signals=intent_signals,
         )
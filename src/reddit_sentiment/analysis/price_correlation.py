@@ -9,6 +9,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from reddit_sentiment.detection.models import MODEL_INFO
 
@@ -92,16 +94,19 @@ class PriceCorrelationAnalyzer:
 
     # Minimum mentions required to include a model in correlation analysis
     MIN_MENTIONS = 3
+    # eBay listing columns read by analyze(); loaders can project to these
+    EBAY_COLUMNS: tuple[str, ...] = ("model", "sold_price_usd")
 
     def analyze(
         self,
         reddit_df: pd.DataFrame,
-        ebay_df: pd.DataFrame,
+        ebay_df: pd.DataFrame | pa.Table,
     ) -> CorrelationResult:
         """
         Args:
             reddit_df: Annotated Reddit DataFrame with 'models' and 'hybrid_score' columns.
-            ebay_df: eBay sold listings DataFrame with 'model' and 'sold_price_usd' columns.
+            ebay_df: eBay sold listings with 'model' and 'sold_price_usd' columns, as a
+                DataFrame or an Arrow table (aggregated with Arrow kernels, no pandas copy).
 
         Returns:
             CorrelationResult with per-model signals and correlation coefficient.
@@ -178,8 +183,10 @@ class PriceCorrelationAnalyzer:
             }
         return result
 
-    def _aggregate_ebay(self, df: pd.DataFrame) -> dict[str, dict]:
+    def _aggregate_ebay(self, df: pd.DataFrame | pa.Table) -> dict[str, dict]:
         """Aggregate sold price stats per shoe model from eBay DataFrame."""
+        if isinstance(df, pa.Table):
+            return self._aggregate_ebay_arrow(df)
         if df.empty or "model" not in df.columns or "sold_price_usd" not in df.columns:
             return {}
 
@@ -196,6 +203,33 @@ class PriceCorrelationAnalyzer:
             }
         return result
 
+    @staticmethod
+    def _aggregate_ebay_arrow(table: pa.Table) -> dict[str, dict]:
+        """Arrow-kernel twin of :meth:`_aggregate_ebay` for an eBay listings table."""
+        if table.num_rows == 0 or not {"model", "sold_price_usd"} <= set(table.column_names):
+            return {}
+
+        prices = table["sold_price_usd"]
+        # Same rows pandas keeps: a model, and a price that is neither null nor NaN
+        table = table.filter(
+            pc.and_(
+                pc.is_valid(table["model"]),
+                pc.and_(pc.is_valid(prices), pc.invert(pc.is_nan(prices))),
+            )
+        )
+        stats = table.group_by("model").aggregate(
+            [("sold_price_usd", agg) for agg in ("count", "mean", "min", "max")]
+        )
+        return {
+            row["model"]: {
+                "num_sales": row["sold_price_usd_count"],
+                "avg_sold_price": round(float(row["sold_price_usd_mean"]), 2),
+                "min_sold_price": round(float(row["sold_price_usd_min"]), 2),
+                "max_sold_price": round(float(row["sold_price_usd_max"]), 2),
+            }
+            for row in stats.to_pylist()
+        }
+
     def _compute_correlation(self, signals: list[ModelSignal]) -> float | None:
         """Pearson r between avg_sentiment and price_premium for models with both signals."""
         paired = [
@@ -26,6 +26,7 @@ from reddit_sentiment.api.models import (
 from reddit_sentiment.config import collection_config
 from reddit_sentiment.detection.brands import BrandDetector
 from reddit_sentiment.detection.models import ModelDetector
+from reddit_sentiment.sentiment.vader import VaderAnalyzer
 
 _ANNOTATED = collection_config.processed_data_dir / "annotated.parquet"
 
@@ -52,11 +53,12 @@ def _load_df() -> pd.DataFrame:
 
 
 # ---------------------------------------------------------------------------
-# Detectors — initialised once at startup
+# Detectors and scorer — initialised once at startup
 # ---------------------------------------------------------------------------
 
 _brand_detector = BrandDetector()
 _model_detector = ModelDetector()
+_vader = VaderAnalyzer()
 
 
 # ---------------------------------------------------------------------------
@@ -198,8 +200,6 @@ def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
 
     Useful for scoring individual Reddit posts or any freeform sneaker text.
     """
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
     text = req.text.strip()
     if not text:
         raise HTTPException(status_code=422, detail="text must not be empty")
@@ -207,8 +207,7 @@ def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
     brands_found = _brand_detector.detect_brands(text)
     models_found = _model_detector.detect_models(text)
 
-    vader = SentimentIntensityAnalyzer()
-    score = vader.polarity_scores(text)["compound"]
+    score = _vader.score(text)
 
     if score >= 0.05:
         label = "Positive"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -137,8 +138,11 @@ def analyze(input_path: str | None, output: str | None, no_transformer: bool) ->
 
     click.echo(f"Loaded {len(df)} records")
 
-    pipeline = SentimentPipeline(use_transformer=not no_transformer)
-    annotated = pipeline.annotate(df)
+    # The CLI owns the pipeline's lifetime, so VADER may use one worker per CPU
+    with SentimentPipeline(
+        use_transformer=not no_transformer, vader_jobs=os.cpu_count()
+    ) as pipeline:
+        annotated = pipeline.annotate(df)
 
     out_path = Path(output) if output else cfg.processed_data_dir / "annotated.parquet"
     annotated.to_parquet(out_path, index=False)
@@ -262,8 +266,8 @@ def pipeline(no_transformer: bool, public: bool) -> None:
     import pandas as pd
 
     df = pd.read_parquet(raw_path)
-    pl = SentimentPipeline(use_transformer=not no_transformer)
-    annotated = pl.annotate(df)
+    with SentimentPipeline(use_transformer=not no_transformer, vader_jobs=os.cpu_count()) as pl:
+        annotated = pl.annotate(df)
     out = cfg.processed_data_dir / "annotated.parquet"
     cfg.processed_data_dir.mkdir(parents=True, exist_ok=True)
     annotated.to_parquet(out, index=False)
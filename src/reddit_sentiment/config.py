@@ -83,6 +83,12 @@ class SentimentConfig(BaseSettings):
     vader_weight: float = 0.4
     context_window: int = 15  # words each side of brand mention
     transformer_batch_size: int = 32
+    # Rows whose |VADER compound| reaches this skip the transformer (hybrid = VADER);
+    # None scores every brand context
+    transformer_skip_vader_abs: float | None = None
+    # CPU hosts: run an int8-quantized ONNX export of the transformer instead
+    use_onnx: bool = Field(default=False, alias="SENTIMENT_USE_ONNX")
+    onnx_model_dir: Path = Field(default=_ROOT / "data" / "models")
     # Score threshold for "positive" classification
     positive_threshold: float = 0.05
     negative_threshold: float = -0.05
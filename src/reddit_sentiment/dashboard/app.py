@@ -9,7 +9,6 @@ Run with:
 from __future__ import annotations
 
 import io
-import random
 import sys
 from pathlib import Path
 
@@ -19,6 +18,7 @@ _SRC = Path(__file__).parent.parent.parent  # .../src/
 if str(_SRC) not in sys.path:
     sys.path.insert(0, str(_SRC))
 
+import numpy as np  # noqa: E402
 import pandas as pd  # noqa: E402
 import plotly.io as pio  # noqa: E402
 import streamlit as st  # noqa: E402
@@ -43,28 +43,51 @@ _ANNOTATED = _ROOT / "data" / "processed" / "annotated.parquet"
 _EBAY_GLOB = "ebay_*.parquet"
 _RAW_DIR = _ROOT / "data" / "raw"
 
+# Subreddit multiselect shows only the most active subreddits; the long tail
+# is reachable through a single "<Other>" option with a substring search.
+_MAX_SUB_OPTIONS = 50
+_OTHER_SUBS = "<Other>"
+
+# Dashboard views, in display order
+_VIEWS = [
+    "📊 Overview",
+    "🏷️ Brands",
+    "🛒 Channels",
+    "💬 Themes",
+    "👟 Models",
+    "🎯 Brand Signals",
+    "🔬 Model Intelligence",
+]
+
 
 # ---------------------------------------------------------------------------
 # Data loading
 # ---------------------------------------------------------------------------
 
 
-@st.cache_data(show_spinner="Loading annotated data…")
-def load_data(path: Path) -> pd.DataFrame:
+@st.cache_resource(show_spinner="Loading data…")
+def _read_parquet_shared(path: str, mtime: float) -> pd.DataFrame:
+    """Read a parquet file once per server process, shared by all sessions.
+
+    *mtime* is only part of the cache key, so a rewritten file is re-read.
+    The returned frame is shared — callers must treat it as read-only.
+    """
     return pd.read_parquet(path)
 
 
-@st.cache_data(show_spinner=False)
+def load_data(path: Path) -> pd.DataFrame:
+    return _read_parquet_shared(str(path), path.stat().st_mtime)
+
+
 def load_ebay(raw_dir: Path) -> pd.DataFrame:
     files = sorted(raw_dir.glob(_EBAY_GLOB), reverse=True)
     if files:
-        return pd.read_parquet(files[0])
+        return _read_parquet_shared(str(files[0]), files[0].stat().st_mtime)
     return pd.DataFrame()
 
 
 def _synthetic_demo() -> pd.DataFrame:
     """Generate 500-row synthetic data for demo when no parquet exists."""
-    random.seed(42)
     brands_pool = [
         ["Nike"], ["Adidas"], ["New Balance"], ["Hoka"], ["Under Armour"],
         ["Nike", "Adidas"], ["Puma"], ["Asics"], [],
@@ -78,26 +101,27 @@ def _synthetic_demo() -> pd.DataFrame:
         "availability_info", "purchase_consideration", None, None, None,
     ]
     subreddits = ["Sneakers", "Nike", "Adidas", "Running", "Jordans", "SneakerMarket"]
-    rows = []
-    for i in range(500):
-        sentiment = random.gauss(0.15, 0.35)
-        rows.append({
-            "id": f"r{i}",
-            "subreddit": random.choice(subreddits),
-            "record_type": "post" if i < 250 else "comment",
-            "score": random.randint(1, 500),
-            "created_utc": pd.Timestamp("2025-10-01", tz="UTC") + pd.Timedelta(hours=i * 3),
-            "full_text": f"Sample text about sneakers #{i}",
-            "vader_score": sentiment,
-            "hybrid_score": min(max(sentiment, -1.0), 1.0),
-            "transformer_score": None,
-            "brands": random.choice(brands_pool),
-            "channels": random.choice(channels_pool),
-            "models": [],
-            "primary_intent": random.choice(intents),
-            "all_intents": [],
-        })
-    return pd.DataFrame(rows)
+    n = 500
+    rng = np.random.default_rng(42)
+    sentiment = rng.normal(0.15, 0.35, n)
+    return pd.DataFrame({
+        "id": [f"r{i}" for i in range(n)],
+        "subreddit": rng.choice(subreddits, n),
+        "record_type": np.where(np.arange(n) < n // 2, "post", "comment"),
+        "score": rng.integers(1, 501, n),
+        "created_utc": pd.Timestamp("2025-10-01", tz="UTC")
+        + pd.to_timedelta(np.arange(n) * 3, unit="h"),
+        "full_text": [f"Sample text about sneakers #{i}" for i in range(n)],
+        "vader_score": sentiment,
+        "hybrid_score": np.clip(sentiment, -1.0, 1.0),
+        "transformer_score": [None] * n,
+        # Object columns: index into the pools rather than choosing from ragged lists
+        "brands": [brands_pool[i] for i in rng.integers(0, len(brands_pool), n)],
+        "channels": [channels_pool[i] for i in rng.integers(0, len(channels_pool), n)],
+        "models": [[] for _ in range(n)],
+        "primary_intent": [intents[i] for i in rng.integers(0, len(intents), n)],
+        "all_intents": [[] for _ in range(n)],
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -173,6 +197,32 @@ def load_health_history() -> pd.DataFrame:
     return pd.DataFrame()
 
 
+@st.cache_data(show_spinner=False)
+def _subreddit_sentiment(sub_scores: pd.DataFrame) -> pd.DataFrame:
+    """Mean hybrid score and record count per subreddit.
+
+    Groups on integer category codes with ``np.bincount`` rather than a hash
+    groupby; expects only the ``subreddit`` and ``hybrid_score`` columns.
+    """
+    valid = sub_scores["subreddit"].notna() & sub_scores["hybrid_score"].notna()
+    cat = pd.Categorical(sub_scores.loc[valid, "subreddit"])
+    n = len(cat.categories)
+    counts = np.bincount(cat.codes, minlength=n)
+    sums = np.bincount(
+        cat.codes,
+        weights=sub_scores.loc[valid, "hybrid_score"].to_numpy(dtype=float),
+        minlength=n,
+    )
+    sub_df = pd.DataFrame({
+        "subreddit": cat.categories,
+        "avg_sentiment": sums / np.maximum(counts, 1),
+        "mentions": counts,
+    })
+    sub_df = sub_df[sub_df["mentions"] > 0].sort_values("avg_sentiment", ascending=False)
+    sub_df["avg_sentiment"] = sub_df["avg_sentiment"].round(4)
+    return sub_df.reset_index(drop=True)
+
+
 def _detect_signal_changes(history: pd.DataFrame) -> list[dict]:
     """Compare the two most recent snapshots; return list of brand signal changes."""
     if history.empty or "signal" not in history.columns:
@@ -209,10 +259,15 @@ def _to_json(df: pd.DataFrame) -> str:
     return df.to_json(orient="split", date_format="iso")
 
 
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _figure(chart_json: str):
+    """Parse chart JSON into a Figure once; reruns with the same chart reuse it."""
+    return pio.from_json(chart_json)
+
+
 def _render(chart_json: str) -> None:
     if chart_json and chart_json != "{}":
-        fig = pio.from_json(chart_json)
-        st.plotly_chart(fig, width="stretch")
+        st.plotly_chart(_figure(chart_json), width="stretch")
     else:
         st.info("Not enough data to render this chart.")
 
@@ -242,21 +297,31 @@ def _sidebar(df: pd.DataFrame) -> tuple[pd.DataFrame, int, bool]:
         st.divider()
         st.subheader("Filters")
 
-        # Subreddit filter
-        all_subs = (
-            sorted(df["subreddit"].dropna().unique().tolist())
+        # Subreddit filter (top-N by record count, long tail behind "<Other>")
+        sub_counts = (
+            df["subreddit"].value_counts()
             if "subreddit" in df.columns
-            else []
+            else pd.Series(dtype="int64")
         )
+        top_subs = sorted(sub_counts.head(_MAX_SUB_OPTIONS).index.tolist())
+        all_subs = top_subs + ([_OTHER_SUBS] if len(sub_counts) > _MAX_SUB_OPTIONS else [])
         selected_subs = st.multiselect(
             "Subreddits",
             options=all_subs,
             default=all_subs,
             help="Filter to specific subreddits",
         )
+        other_query = ""
+        if _OTHER_SUBS in selected_subs:
+            other_query = st.text_input(
+                "Other subreddits containing",
+                help="Substring match on the less active subreddits (blank = all)",
+            )
+
+        # Filters accumulate into one row mask, applied once below
+        mask = np.ones(len(df), dtype=bool)
 
         # Date range
-        filtered = df.copy()
         if "created_utc" in df.columns:
             try:
                 dates = pd.to_datetime(df["created_utc"], utc=True)
@@ -271,14 +336,22 @@ def _sidebar(df: pd.DataFrame) -> tuple[pd.DataFrame, int, bool]:
                 )
                 if isinstance(date_range, list | tuple) and len(date_range) == 2:
                     start, end = date_range
-                    mask = (dates.dt.date >= start) & (dates.dt.date <= end)
-                    filtered = filtered[mask]
+                    lo = pd.Timestamp(start, tz="UTC")
+                    hi = pd.Timestamp(end, tz="UTC") + pd.Timedelta(days=1)
+                    mask &= ((dates >= lo) & (dates < hi)).to_numpy()
             except Exception:
                 pass
 
-        # Apply subreddit filter
-        if selected_subs and "subreddit" in filtered.columns:
-            filtered = filtered[filtered["subreddit"].isin(selected_subs)]
+        # Subreddit filter
+        if selected_subs and "subreddit" in df.columns:
+            subs = df["subreddit"]
+            keep = subs.isin(selected_subs)
+            if _OTHER_SUBS in selected_subs:
+                tail = ~subs.isin(top_subs) & subs.notna()
+                if other_query:
+                    tail &= subs.str.contains(other_query, case=False, regex=False, na=False)
+                keep |= tail
+            mask &= keep.to_numpy()
 
         # Record type filter
         if "record_type" in df.columns:
@@ -288,7 +361,9 @@ def _sidebar(df: pd.DataFrame) -> tuple[pd.DataFrame, int, bool]:
                 default=["post", "comment"],
             )
             if record_types:
-                filtered = filtered[filtered["record_type"].isin(record_types)]
+                mask &= df["record_type"].isin(record_types).to_numpy()
+
+        filtered = df if mask.all() else df.loc[mask]
 
         st.divider()
         st.subheader("Analysis options")
@@ -350,14 +425,7 @@ def _tab_overview(df: pd.DataFrame, brand_metrics: dict, attribution, trends) ->
     # Top-level subreddit breakdown
     if "subreddit" in df.columns and "hybrid_score" in df.columns:
         st.subheader("Sentiment by Subreddit")
-        sub_df = (
-            df.groupby("subreddit")["hybrid_score"]
-            .agg(["mean", "count"])
-            .rename(columns={"mean": "avg_sentiment", "count": "mentions"})
-            .sort_values("avg_sentiment", ascending=False)
-            .reset_index()
-        )
-        sub_df["avg_sentiment"] = sub_df["avg_sentiment"].round(4)
+        sub_df = _subreddit_sentiment(df[["subreddit", "hybrid_score"]])
 
         import plotly.express as px
         fig = px.bar(
@@ -753,8 +821,6 @@ def _tab_brand_signals(intel_result) -> None:
 
     # 5 — Health score trend + 30-day forecast
     if not history.empty and history["timestamp"].nunique() >= 2:
-        import numpy as np
-
         st.divider()
         st.subheader("Brand Health Score — Trend & 30-Day Forecast")
         fig_trend = px.line(
@@ -969,51 +1035,43 @@ def main() -> None:
     df_json = _to_json(df)
     ebay_json = _to_json(ebay_df) if not ebay_df.empty else ""
 
-    # Run all analyses
+    # KPI cards need brand + channel results regardless of the active view
     with st.spinner("Running analyses…"):
         brand_metrics, brand_table = run_brand_analysis(df_json, min_mentions)
         attribution = run_channel_analysis(df_json)
-        narrative = run_narrative_analysis(df_json)
-        trends = run_trend_analysis(df_json)
-        corr_result = run_model_analysis(df_json, ebay_json)
-        intel_result = run_brand_signals(df_json, min_mentions)
-        model_intel_result = run_model_intelligence(df_json)
 
     # KPI strip
     _kpi_cards(df, brand_metrics, attribution)
     st.divider()
 
-    # Tabs
-    tab_ov, tab_br, tab_ch, tab_th, tab_mo, tab_intel, tab_mintel = st.tabs([
-        "📊 Overview",
-        "🏷️ Brands",
-        "🛒 Channels",
-        "💬 Themes",
-        "👟 Models",
-        "🎯 Brand Signals",
-        "🔬 Model Intelligence",
-    ])
-
-    with tab_ov:
-        _tab_overview(df, brand_metrics, attribution, trends)
-
-    with tab_br:
-        _tab_brands(df, brand_metrics, brand_table)
-
-    with tab_ch:
-        _tab_channels(attribution)
-
-    with tab_th:
-        _tab_themes(narrative)
-
-    with tab_mo:
-        _tab_models(corr_result, has_ebay=not ebay_df.empty, df_json=df_json)
-
-    with tab_intel:
-        _tab_brand_signals(intel_result)
+    # View selector — unlike st.tabs, only the selected view is computed
+    default_view = st.query_params.get("view", _VIEWS[0])
+    view = st.radio(
+        "View",
+        _VIEWS,
+        index=_VIEWS.index(default_view) if default_view in _VIEWS else 0,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="active_tab",
+    )
+    st.query_params["view"] = view
 
-    with tab_mintel:
-        _tab_model_intelligence(model_intel_result)
+    with st.spinner("Running analyses…"):
+        if view == "📊 Overview":
+            _tab_overview(df, brand_metrics, attribution, run_trend_analysis(df_json))
+        elif view == "🏷️ Brands":
+            _tab_brands(df, brand_metrics, brand_table)
+        elif view == "🛒 Channels":
+            _tab_channels(attribution)
+        elif view == "💬 Themes":
+            _tab_themes(run_narrative_analysis(df_json))
+        elif view == "👟 Models":
+            corr_result = run_model_analysis(df_json, ebay_json)
+            _tab_models(corr_result, has_ebay=not ebay_df.empty, df_json=df_json)
+        elif view == "🎯 Brand Signals":
+            _tab_brand_signals(run_brand_signals(df_json, min_mentions))
+        elif view == "🔬 Model Intelligence":
+            _tab_model_intelligence(run_model_intelligence(df_json))
 
 
 if __name__ == "__main__":
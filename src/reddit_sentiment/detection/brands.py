@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from reddit_sentiment.config import SentimentConfig
+from reddit_sentiment.detection.patterns import fold
 
 # ---------------------------------------------------------------------------
 # Brand alias registry
@@ -93,7 +97,55 @@ BRAND_ALIASES: dict[str, list[str]] = {
 }
 
 
-@dataclass
+# ---------------------------------------------------------------------------
+# Compiled pattern tables (built once per process)
+# ---------------------------------------------------------------------------
+
+
+def _build_tables() -> tuple[
+    list[str],
+    list[tuple[str, int]],
+    list[tuple[re.Pattern, int, tuple[str, ...]]],
+    np.ndarray,
+]:
+    """Compile one pattern per brand from :data:`BRAND_ALIASES`.
+
+    Each pattern matches empty at every position where one of the brand's
+    aliases starts, with one capture group per alias (in declaration order)
+    set for every alias found there. A scan therefore yields one mention per
+    matched alias span, overlapping aliases included, as separate per-alias
+    patterns would.
+
+    Returns:
+        (idx_to_brand, aliases, patterns, alias_brand) — interned brand names,
+        the flat ``(alias, brand_idx)`` table indexed by alias_idx, one
+        ``(pattern, alias_idx of group 1, screen)`` triple per brand, and an
+        int16 alias_idx → brand_idx array. ``screen`` holds the lowercased
+        leading trigram of each alias: a text that contains none of them
+        cannot match the pattern.
+    """
+    idx_to_brand = [sys.intern(brand) for brand in BRAND_ALIASES]
+    aliases: list[tuple[str, int]] = []
+    patterns: list[tuple[re.Pattern, int, tuple[str, ...]]] = []
+    for brand_idx, brand_aliases in enumerate(BRAND_ALIASES.values()):
+        offset = len(aliases)
+        aliases.extend((sys.intern(alias), brand_idx) for alias in brand_aliases)
+        # Word-boundary match, case-insensitive; the leading lookahead only lets
+        # the scan stop where some alias starts, the optional ones record which
+        escaped = [re.escape(alias) for alias in brand_aliases]
+        anchor = r"\b(?=(?:" + "|".join(escaped) + r")\b)"
+        groups = "".join(r"(?:(?=(" + alias + r")\b))?" for alias in escaped)
+        pat = re.compile(anchor + groups, re.IGNORECASE)
+        screen = tuple(dict.fromkeys(fold(alias)[:3] for alias in brand_aliases))
+        patterns.append((pat, offset, screen))
+    alias_brand = np.array([b for _, b in aliases], dtype=np.int16)
+    return idx_to_brand, aliases, patterns, alias_brand
+
+
+_IDX_TO_BRAND, _ALIASES, _PATTERNS, _ALIAS_BRAND = _build_tables()
+
+
+@dataclass(slots=True)
 class BrandMention:
     """A single detected mention of a brand within a text."""
 
@@ -107,75 +159,140 @@ class BrandMention:
 
 
 class BrandDetector:
-    """Detect sneaker brand mentions in text using pre-compiled regex patterns."""
+    """Detect sneaker brand mentions in text using pre-compiled regex patterns.
+
+    Each brand's aliases are folded into a single pattern, so a text is
+    scanned once per brand. Every matched alias yields its own mention, even
+    where aliases overlap ("Adidas Originals" and "Adidas").
+    The compiled patterns live at module scope, so constructing a detector is
+    cheap and instances only differ in their context window.
+    """
 
     def __init__(self, context_window: int | None = None) -> None:
         cfg = SentimentConfig()
         self._window = context_window if context_window is not None else cfg.context_window
-        # Build: brand → list of (compiled_pattern, alias_string)
-        self._patterns: dict[str, list[tuple[re.Pattern, str]]] = {}
-        for brand, aliases in BRAND_ALIASES.items():
-            compiled = []
-            for alias in aliases:
-                # Word-boundary match, case-insensitive
-                pat = re.compile(r"\b" + re.escape(alias) + r"\b", re.IGNORECASE)
-                compiled.append((pat, alias))
-            self._patterns[brand] = compiled
-
-    def detect(self, text: str) -> list[BrandMention]:
-        """Return all brand mentions found in *text*, in order of occurrence."""
+        # Pattern tables are built once at import and shared by every detector
+        self._idx_to_brand = _IDX_TO_BRAND
+        self._aliases = _ALIASES
+        self._patterns = _PATTERNS
+        self._alias_brand = _ALIAS_BRAND
+
+    def _scan(
+        self, text: str, folded: str | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run each brand pattern over *text*; return (starts, ends, alias_idx) ordered by start."""
+        starts: list[int] = []
+        ends: list[int] = []
+        alias_idx: list[int] = []
+        if folded is None:
+            folded = fold(text)
+        for pat, offset, screen in self._patterns:
+            # Cheap substring screen: skip the regex scan when no alias prefix occurs
+            if not any(gram in folded for gram in screen):
+                continue
+            for m in pat.finditer(text):
+                # Unmatched alias groups span (-1, -1)
+                for group in range(pat.groups):
+                    start, end = m.span(group + 1)
+                    if start >= 0:
+                        starts.append(start)
+                        ends.append(end)
+                        alias_idx.append(offset + group)
+
+        start_arr = np.array(starts, dtype=np.int32)
+        # Stable sort keeps brand order for mentions sharing a start offset
+        order = np.argsort(start_arr, kind="stable")
+        return (
+            start_arr[order],
+            np.array(ends, dtype=np.int32)[order],
+            np.array(alias_idx, dtype=np.int32)[order],
+        )
+
+    def detect_raw(self, text: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return brand matches in *text* as parallel arrays, in order of occurrence.
+
+        Returns:
+            (starts, ends, brand_idx) — int32 character offsets and int16 indices
+            into :attr:`brands`. No ``BrandMention`` objects are allocated.
+        """
+        if not text:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty, np.empty(0, dtype=np.int16)
+        starts, ends, alias_idx = self._scan(text)
+        return starts, ends, self._alias_brand[alias_idx]
+
+    @property
+    def brands(self) -> list[str]:
+        """Canonical brand names, indexed by the ``brand_idx`` values of :meth:`detect_raw`."""
+        return list(self._idx_to_brand)
+
+    def detect(
+        self, text: str, context: bool = True, folded: str | None = None
+    ) -> list[BrandMention]:
+        """Return all brand mentions found in *text*, in order of occurrence.
+
+        Args:
+            text: Text to scan.
+            context: Extract the ±window context words for each mention. Pass
+                ``False`` when only brand identity/offsets are needed; mentions
+                then carry an empty context.
+            folded: ``fold(text)``, if the caller has already computed it.
+        """
         if not text:
             return []
 
-        words = text.split()
+        starts, ends, alias_idx = self._scan(text, folded)
+        words = text.split() if context else []
         mentions: list[BrandMention] = []
 
-        for brand, pat_list in self._patterns.items():
-            for pat, alias in pat_list:
-                for m in pat.finditer(text):
-                    context, before, after = self._extract_context(words, text, m)
-                    mentions.append(
-                        BrandMention(
-                            brand=brand,
-                            alias=alias,
-                            start=m.start(),
-                            end=m.end(),
-                            context=context,
-                            context_words_before=before,
-                            context_words_after=after,
-                        )
-                    )
-
-        # Sort by character position
-        mentions.sort(key=lambda mn: mn.start)
+        for start, end, idx in zip(starts.tolist(), ends.tolist(), alias_idx.tolist()):
+            alias, brand_idx = self._aliases[idx]
+            if context:
+                context_str, before, after = self._extract_context(words, text, start, end)
+            else:
+                context_str, before, after = "", [], []
+            mentions.append(
+                BrandMention(
+                    brand=self._idx_to_brand[brand_idx],
+                    alias=alias,
+                    start=start,
+                    end=end,
+                    context=context_str,
+                    context_words_before=before,
+                    context_words_after=after,
+                )
+            )
+
         return mentions
 
     def detect_brands(self, text: str) -> list[str]:
         """Return deduplicated canonical brand names found in text."""
-        seen: list[str] = []
-        for m in self.detect(text):
-            if m.brand not in seen:
-                seen.append(m.brand)
-        return seen
+        _starts, _ends, brand_idx = self.detect_raw(text)
+        if not brand_idx.size:
+            return []
+        # First occurrence of each brand, re-ordered by position in the text
+        unique, first_pos = np.unique(brand_idx, return_index=True)
+        return [self._idx_to_brand[i] for i in unique[np.argsort(first_pos)].tolist()]
 
     def _extract_context(
         self,
         words: list[str],
         text: str,
-        match: re.Match,
+        start: int,
+        end: int,
     ) -> tuple[str, list[str], list[str]]:
-        """Extract ±window words around a regex match."""
+        """Extract ±window words around the match spanning ``text[start:end]``."""
         # Find which word index the match start falls in
         pos = 0
         match_word_idx: int | None = None
         for idx, word in enumerate(words):
-            if pos + len(word) >= match.start():
+            if pos + len(word) >= start:
                 match_word_idx = idx
                 break
             pos += len(word) + 1  # +1 for space
 
         if match_word_idx is None:
-            return text[max(0, match.start() - 50) : match.end() + 50], [], []
+            return text[max(0, start - 50) : end + 50], [], []
 
         start_idx = max(0, match_word_idx - self._window)
         end_idx = min(len(words), match_word_idx + self._window + 1)
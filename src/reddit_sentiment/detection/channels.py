@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
+from typing import Final
 from urllib.parse import urlparse
 
+from reddit_sentiment.detection.patterns import trie_regex
+
 # ---------------------------------------------------------------------------
 # Domain → channel mapping (40+ retailers)
 # ---------------------------------------------------------------------------
 
-DOMAIN_TO_CHANNEL: dict[str, str] = {
+DOMAIN_TO_CHANNEL: Final[dict[str, str]] = {
     # Nike Direct
     "nike.com": "Nike Direct",
     "snkrs.com": "Nike Direct",
@@ -63,10 +68,51 @@ DOMAIN_TO_CHANNEL: dict[str, str] = {
     "holabird.com": "Holabird Sports",
 }
 
+
+def _build_domain_trie(mapping: dict[str, str]) -> dict:
+    """Index domains by reversed labels: ``"nike.com"`` → ``{"com": {"nike": {"": ...}}}``.
+
+    The ``""`` key (never a valid label) holds the channel for the path so far.
+    """
+    trie: dict = {}
+    for domain, channel in mapping.items():
+        node = trie
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[""] = channel
+    return trie
+
+
+# Interned channel names: the URL and keyword maps, and every detection result,
+# share one object per channel, so dedup and equality checks hit the identity
+# fast path
+DOMAIN_TO_CHANNEL.update({d: sys.intern(c) for d, c in DOMAIN_TO_CHANNEL.items()})
+
+_DOMAIN_TRIE = _build_domain_trie(DOMAIN_TO_CHANNEL)
+
+
+@functools.lru_cache(maxsize=4096)
+def _channel_for_domain(domain: str) -> str | None:
+    """Return the channel of the most specific mapped suffix of *domain*.
+
+    Subdomains resolve to their parent (``m.nike.com`` → Nike Direct) unless
+    they are mapped themselves (``consortium.adidas.com``). Ports are ignored.
+    """
+    node: dict = _DOMAIN_TRIE
+    channel: str | None = None
+    for label in reversed(domain.partition(":")[0].split(".")):
+        child = node.get(label) if label else None  # "" would hit a channel entry
+        if child is None:
+            break
+        node = child
+        channel = node.get("", channel)
+    return channel
+
+
 # Keyword → channel (for mentions without a URL)
 # Note: "rei" intentionally omitted — too short, matches inside other words.
 # REI.com is still detected via URL domain mapping above.
-_KEYWORD_TO_CHANNEL: dict[str, str] = {
+_KEYWORD_TO_CHANNEL: Final[dict[str, str]] = {
     "stockx": "StockX",
     "goat": "GOAT",
     "foot locker": "Foot Locker",
@@ -91,18 +137,36 @@ _KEYWORD_TO_CHANNEL: dict[str, str] = {
     "bodega": "Bodega",
     "ebay": "eBay",
 }
+_KEYWORD_TO_CHANNEL.update({k: sys.intern(c) for k, c in _KEYWORD_TO_CHANNEL.items()})
 
-# Pre-compiled keyword pattern — longest first, word boundaries to prevent
-# partial matches (e.g. "rei" inside "received", "kith" inside "skither")
+# Pre-compiled keyword pattern — one prefix-sharing trie, word boundaries to
+# prevent partial matches (e.g. "rei" inside "received", "kith" inside
+# "skither"). The leading character class lets the regex engine skip offsets
+# that cannot start a keyword.
 _sorted_keywords = sorted(_KEYWORD_TO_CHANNEL, key=len, reverse=True)
 _KEYWORD_PATTERN = re.compile(
-    "|".join(r"\b" + re.escape(k) + r"\b" for k in _sorted_keywords),
+    "(?=["
+    + re.escape("".join(sorted({k[0] for k in _sorted_keywords})))
+    + r"])\b"
+    + trie_regex(_sorted_keywords)
+    + r"\b",
     re.IGNORECASE,
 )
 
 
+# Host-only strings need no URL parsing
+_BARE_DOMAIN = re.compile(r"[A-Za-z0-9.-]+")
+
+
+@functools.lru_cache(maxsize=65536)
 def _domain_from_url(url: str) -> str:
-    """Extract normalised domain (strip www.) from a URL string."""
+    """Extract normalised domain (strip www.) from a URL string.
+
+    Cached: retailer URLs recur across a corpus. Bare domains (``stockx.com``)
+    skip ``urlparse`` entirely.
+    """
+    if _BARE_DOMAIN.fullmatch(url) and not url.startswith("http"):
+        return url.lower().removeprefix("www.")
     try:
         parsed = urlparse(url if url.startswith("http") else f"https://{url}")
         domain = parsed.netloc.lower()
@@ -118,31 +182,27 @@ class ChannelDetector:
 
     def detect_from_urls(self, urls: list[str]) -> list[str]:
         """Map URL list → deduplicated channel names."""
-        channels: list[str] = []
+        # dict keys: insertion-ordered with O(1) membership
+        seen: dict[str, None] = {}
         for url in urls:
-            domain = _domain_from_url(url)
-            channel = DOMAIN_TO_CHANNEL.get(domain)
-            if channel and channel not in channels:
-                channels.append(channel)
-        return channels
+            channel = _channel_for_domain(_domain_from_url(url))
+            if channel:
+                seen[channel] = None
+        return list(seen)
 
     def detect_from_text(self, text: str) -> list[str]:
         """Scan text for retail keywords → channel names."""
         if not text:
             return []
-        channels: list[str] = []
-        for m in _KEYWORD_PATTERN.finditer(text):
-            channel = _KEYWORD_TO_CHANNEL.get(m.group(0).lower())
-            if channel and channel not in channels:
-                channels.append(channel)
-        return channels
+        seen: dict[str, None] = {}
+        for keyword in _KEYWORD_PATTERN.findall(text):
+            channel = _KEYWORD_TO_CHANNEL.get(keyword.lower())
+            if channel:
+                seen[channel] = None
+        return list(seen)
 
     def detect(self, text: str, urls: list[str] | None = None) -> list[str]:
         """Combined detection: URL domains first, then text keywords."""
-        channels: list[str] = []
-        if urls:
-            channels.extend(self.detect_from_urls(urls))
-        for ch in self.detect_from_text(text):
-            if ch not in channels:
-                channels.append(ch)
-        return channels
+        seen = dict.fromkeys(self.detect_from_urls(urls) if urls else ())
+        seen.update(dict.fromkeys(self.detect_from_text(text)))
+        return list(seen)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+from reddit_sentiment.detection.patterns import fold
+
 # ---------------------------------------------------------------------------
 # Intent definitions (priority order — first match wins for primary intent)
 # ---------------------------------------------------------------------------
@@ -73,11 +76,83 @@ _INTENT_PATTERNS: dict[str, list[str]] = {
 }
 
 # Pre-compile all patterns for performance
+_LEAD = re.compile(r"\\b(?:(\w)|\((?:\?:)?([\w|]+)\))")
+_GROUP_OPEN = re.compile(r"(?<!\\)\((?!\?)")
+
+
+def _noncapturing(pattern: str) -> str:
+    """Turn every capturing group in *pattern* into a non-capturing one."""
+    return _GROUP_OPEN.sub("(?:", pattern)
+
+
+def _first_chars(pattern: str) -> str:
+    """Characters a match of *pattern* can start with, or "" if not derivable.
+
+    Handles the two openings used above: ``\\bword`` and ``\\b(alt|alt)``
+    (capturing or not).
+    """
+    m = _LEAD.match(pattern)
+    if not m:
+        return ""
+    if m.group(1):
+        return m.group(1).lower()
+    return "".join(sorted({alt[0].lower() for alt in m.group(2).split("|") if alt}))
+
+
+def _compile(pattern: str, chars: str | None = None) -> re.Pattern:
+    """Compile *pattern* case-insensitively behind a first-character guard.
+
+    A leading character class lets the regex engine jump between candidate
+    offsets with a set search instead of attempting the full pattern (and its
+    ``\\b``) at every offset; matches are unchanged. *chars* defaults to
+    :func:`_first_chars` of the pattern.
+    """
+    if chars is None:
+        chars = _first_chars(pattern)
+    guard = "(?=[" + re.escape(chars) + "])" if chars else ""
+    return re.compile(guard + pattern, re.IGNORECASE)
+
+
+# Groups are non-capturing so ``findall`` returns whole matches
 _COMPILED: dict[str, list[re.Pattern]] = {
-    intent: [re.compile(p, re.IGNORECASE) for p in patterns]
+    intent: [_compile(_noncapturing(p)) for p in patterns]
     for intent, patterns in _INTENT_PATTERNS.items()
 }
 
+# ---------------------------------------------------------------------------
+# Literal prefilter
+# ---------------------------------------------------------------------------
+
+# Most texts carry no purchase signal, and nearly every pattern above contains
+# a plain word any match must include ("copped" in ``\bjust\s+copped\b``,
+# "sale" in ``\bfor\s+sale\b``). A substring test for that word on the folded
+# text rules a pattern out before its regex is run.
+_TOKEN = re.compile(r"\\.|\[[^\]]*\]|\{[^}]*\}|\([^()]*\)|.")
+
+
+def _literal(pattern: str) -> str | None:
+    """Longest case-folded literal that every match of *pattern* contains.
+
+    Escapes, classes, groups and ``.`` end a literal run; ``?``, ``*`` and
+    ``{m,n}`` also drop the character they quantify. Returns None when the
+    pattern has no literal (or a top-level ``|``), i.e. it is always scanned.
+    """
+    runs: list[str] = []
+    run = ""
+    for token in _TOKEN.findall(pattern):
+        if token == "|":
+            return None
+        if len(token) == 1 and (token.isalnum() or token == "_"):
+            run += token
+            continue
+        if token in ("?", "*") or token.startswith("{"):
+            run = run[:-1]
+        runs.append(run)
+        run = ""
+    runs.append(run)
+    return max(runs, key=len).casefold() or None
+
+
 # Priority order for primary_intent resolution
 _PRIORITY = [
     "completed_purchase",
@@ -89,6 +164,16 @@ _PRIORITY = [
     "price_discussion",
 ]
 
+# (intent, ((literal, pattern), ...)) in priority order — the iteration target
+# of ``classify``
+_FLAT: tuple[tuple[str, tuple[tuple[str | None, re.Pattern], ...]], ...] = tuple(
+    (
+        intent,
+        tuple((_literal(p), pat) for p, pat in zip(_INTENT_PATTERNS[intent], _COMPILED[intent])),
+    )
+    for intent in _PRIORITY
+)
+
 
 @dataclass
 class IntentResult:
@@ -102,19 +187,22 @@ class IntentResult:
 class PurchaseIntentClassifier:
     """Classify purchase intent signals in Reddit text."""
 
-    def classify(self, text: str) -> IntentResult:
+    def classify(self, text: str, folded: str | None = None) -> IntentResult:
+        """Classify *text*; *folded* is ``fold(text)``, if the caller already has it."""
         if not text:
             return IntentResult(None, [], {})
 
         all_intents: list[str] = []
         matched_patterns: dict[str, list[str]] = {}
 
-        for intent in _PRIORITY:
-            pats = _COMPILED[intent]
-            snippets = []
-            for pat in pats:
-                for m in pat.finditer(text):
-                    snippets.append(m.group(0))
+        if folded is None:
+            folded = fold(text)
+
+        for intent, slots in _FLAT:
+            snippets: list[str] = []
+            for literal, pattern in slots:
+                if literal is None or literal in folded:
+                    snippets.extend(pattern.findall(text))
             if snippets:
                 all_intents.append(intent)
                 matched_patterns[intent] = snippets
@@ -125,3 +213,37 @@ class PurchaseIntentClassifier:
             all_intents=all_intents,
             matched_patterns=matched_patterns,
         )
+
+    def classify_batch(
+        self, texts: Sequence[str], folded: Sequence[str] | None = None
+    ) -> list[IntentResult]:
+        """Classify many texts at once; same results as :meth:`classify` per text.
+
+        Each distinct literal is looked up across all folded texts once, and a
+        pattern's regex then runs only on the rows containing its literal.
+        """
+        if folded is None:
+            folded = [fold(t) for t in texts]
+        everyone = range(len(texts))
+        candidates: dict[str | None, Sequence[int]] = {None: everyone}
+        matched: list[dict[str, list[str]]] = [{} for _ in texts]
+
+        for intent, slots in _FLAT:
+            for literal, pattern in slots:
+                rows = candidates.get(literal)
+                if rows is None:
+                    rows = candidates[literal] = [i for i in everyone if literal in folded[i]]
+                for i in rows:
+                    found = pattern.findall(texts[i])
+                    if found:
+                        matched[i].setdefault(intent, []).extend(found)
+
+        # Intents were visited in priority order, so each dict's keys already are
+        return [
+            IntentResult(
+                primary_intent=next(iter(patterns), None),
+                all_intents=list(patterns),
+                matched_patterns=patterns,
+            )
+            for patterns in matched
+        ]
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from dataclasses import dataclass
 
+import pandas as pd
+
+from reddit_sentiment.detection.patterns import trie_regex
+
 # ---------------------------------------------------------------------------
 # Model alias registry
 # canonical name → (brand, retail_price_usd, [aliases])
@@ -98,7 +104,56 @@ MODEL_INFO: dict[str, tuple[str, float]] = {
 # Compiled patterns
 # ---------------------------------------------------------------------------
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _build_tables() -> tuple[
+    list[tuple[str, str, str, float]], dict[str, int], re.Pattern, re.Pattern
+]:
+    """Compile the alias tables of :class:`ModelDetector` from :data:`MODEL_CATALOG`.
+
+    Returns:
+        (aliases, alias_idx, pattern, alias_lookup) — the flat longest-first
+        ``(alias, model, brand, retail_price)`` table, lowercased alias → index
+        into it, the trie scan pattern and the per-alias fallback lookup.
+    """
+    # Flat alias table (alias, model, brand, retail_price); names are
+    # interned so every mention of a model shares one string object
+    aliases: list[tuple[str, str, str, float]] = sorted(
+        (
+            (alias, sys.intern(model), sys.intern(brand), retail)
+            for model, (brand, retail, names) in MODEL_CATALOG.items()
+            for alias in names
+        ),
+        # Longest-first so longer matches win over shorter ones; the sort is
+        # stable, so equal-length aliases keep catalog order
+        key=lambda entry: len(entry[0]),
+        reverse=True,
+    )
+    # Lowercased alias → index into aliases; the first (longest, earliest)
+    # entry wins, as it would in the alternation
+    alias_idx: dict[str, int] = {}
+    for i, (alias, *_) in enumerate(aliases):
+        alias_idx.setdefault(alias.lower(), i)
+    first_chars = sorted({alias[0].lower() for alias, *_ in aliases})
+    # Aliases share prefixes ("Air Jordan ", "Yeezy ", "New Balance ") in one
+    # trie-shaped alternation, which still prefers the longest alias at each
+    # offset. The leading character class lets the regex engine skip
+    # offsets that cannot start an alias.
+    pattern = re.compile(
+        "(?=[" + re.escape("".join(first_chars)) + r"])\b(?P<match_text>"
+        + trie_regex([alias for alias, *_ in aliases])
+        + r")\b",
+        re.IGNORECASE,
+    )
+    # Fallback for matched text whose lowercase is not an alias key (Unicode
+    # case folds such as "ſ" ~ "s"); one capture group per alias
+    alias_lookup = re.compile(
+        "|".join("(" + re.escape(alias) + ")" for alias, *_ in aliases),
+        re.IGNORECASE,
+    )
+    return aliases, alias_idx, pattern, alias_lookup
+
+
+@dataclass(slots=True)
 class ModelMention:
     model: str       # canonical model name
     brand: str
@@ -109,47 +164,60 @@ class ModelMention:
 
 
 class ModelDetector:
-    """Detect specific shoe model mentions using pre-compiled word-boundary patterns."""
+    """Detect specific shoe model mentions using a pre-compiled word-boundary pattern.
+
+    All aliases are folded into one prefix-sharing alternation, so a text is
+    scanned once and each position resolves to the longest alias that matches
+    there. Matches never overlap.
+    """
 
     def __init__(self) -> None:
-        # Build: canonical_name → list of (pattern, alias, brand, retail_price)
-        self._patterns: list[tuple[re.Pattern, str, str, str, float]] = []
-        for model, (brand, retail, aliases) in MODEL_CATALOG.items():
-            # Sort aliases longest-first so longer matches win over shorter ones
-            for alias in sorted(aliases, key=len, reverse=True):
-                pat = re.compile(r"\b" + re.escape(alias) + r"\b", re.IGNORECASE)
-                self._patterns.append((pat, alias, model, brand, retail))
+        # Alias tables and patterns are built on first use and shared by every detector
+        self._aliases, self._alias_idx, self._pattern, self._alias_lookup = _build_tables()
+
+    def _alias_index(self, matched: str) -> int:
+        """Index into ``_aliases`` of the alias that *matched* text spells."""
+        idx = self._alias_idx.get(matched.lower())
+        if idx is None:
+            idx = self._alias_lookup.fullmatch(matched).lastindex - 1
+        return idx
 
     def detect(self, text: str) -> list[ModelMention]:
-        """Return all model mentions found in text, deduplicated by character span."""
+        """Return all model mentions found in text, in order of occurrence."""
         if not text:
             return []
 
         mentions: list[ModelMention] = []
-        covered: list[tuple[int, int]] = []  # track matched spans to avoid overlap
-
-        for pat, alias, model, brand, retail in self._patterns:
-            for m in pat.finditer(text):
-                # Skip if this span overlaps an already-matched span
-                if any(s <= m.start() < e or s < m.end() <= e for s, e in covered):
-                    continue
-                covered.append((m.start(), m.end()))
-                mentions.append(ModelMention(
-                    model=model,
-                    brand=brand,
-                    alias=alias,
-                    start=m.start(),
-                    end=m.end(),
-                    retail_price=retail,
-                ))
-
-        mentions.sort(key=lambda mn: mn.start)
+        for m in self._pattern.finditer(text):
+            alias, model, brand, retail = self._aliases[self._alias_index(m.group(0))]
+            start, end = m.span()
+            mentions.append(ModelMention(
+                model=model,
+                brand=brand,
+                alias=alias,
+                start=start,
+                end=end,
+                retail_price=retail,
+            ))
         return mentions
 
+    def detect_batch(self, texts: pd.Series) -> pd.DataFrame:
+        """Detect model mentions across a column of texts in one vectorised scan.
+
+        Returns:
+            One row per mention, indexed like ``Series.str.extractall`` (the
+            original index plus a ``match`` level), with columns ``model``,
+            ``brand``, ``alias`` and ``retail_price``. Mentions per text are
+            the same as :meth:`detect`, in order of occurrence.
+        """
+        matched = texts.str.extractall(self._pattern)["match_text"]
+        # Distinct matched strings are few; resolve each to its alias row once
+        alias_idx = {text: self._alias_index(text) for text in matched.unique()}
+        rows = [self._aliases[alias_idx[text]] for text in matched]
+        result = pd.DataFrame(rows, columns=["alias", "model", "brand", "retail_price"])
+        result.index = matched.index
+        return result[["model", "brand", "alias", "retail_price"]]
+
     def detect_models(self, text: str) -> list[str]:
         """Return deduplicated canonical model names found in text."""
-        seen: list[str] = []
-        for m in self.detect(text):
-            if m.model not in seen:
-                seen.append(m.model)
-        return seen
+        return list(dict.fromkeys(m.model for m in self.detect(text)))
@@ -0,0 +1,41 @@
+"""Shared regex builders and text folding for the keyword/alias detectors."""
+
+from __future__ import annotations
+
+import re
+
+
+def trie_regex(words: list[str]) -> str:
+    """Build an alternation over *words* that shares common prefixes.
+
+    ``["foot locker", "footlocker"]`` becomes ``foot(?:\\ locker|locker)``. At
+    each node longer continuations are tried before stopping, so the regex
+    prefers the longest word at a position, like a longest-first alternation.
+    Words are lowercased; compile the result with ``re.IGNORECASE``.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-word marker
+
+    def emit(node: dict) -> str:
+        alts = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if "" in node:
+            alts.append("")
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+    return emit(trie)
+
+
+def fold(text: str) -> str:
+    """Case-fold *text* for substring screens run ahead of ``re.IGNORECASE`` scans.
+
+    ``str.casefold`` covers every character ``re.IGNORECASE`` equates with an
+    ASCII letter except the Turkish dotted/dotless i, handled here.
+    """
+    folded = text.casefold()
+    if folded.isascii():
+        return folded
+    return folded.replace("i\u0307", "i").replace("\u0131", "i")
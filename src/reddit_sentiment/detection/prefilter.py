@@ -0,0 +1,96 @@
+"""Optional Hyperscan prefilter: one multi-pattern scan that tells which detectors can match.
+
+Requires ``hyperscan``; :func:`load_prefilter` returns None without it and every
+detector then runs on every text, as before.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+
+from reddit_sentiment.detection.brands import BRAND_ALIASES
+from reddit_sentiment.detection.channels import _KEYWORD_TO_CHANNEL
+from reddit_sentiment.detection.intent import _INTENT_PATTERNS
+from reddit_sentiment.detection.models import MODEL_CATALOG
+
+try:
+    import hyperscan  # type: ignore[import]
+except ImportError:  # pragma: no cover - depends on the environment
+    hyperscan = None
+
+_GAP = re.compile(r"\.\{\d*,?\d*\}")
+
+
+def _loosen(pattern: str) -> str:
+    """Widen an intent pattern so it matches wherever the original can.
+
+    Word boundaries are dropped and ``.{m,n}`` gaps become ``.*``, since case
+    folding can lengthen the text between two words.
+    """
+    return _GAP.sub(".*", pattern.replace(r"\b", ""))
+
+
+class DetectorPrefilter:
+    """A Hyperscan database over every brand, model, channel and intent pattern.
+
+    :meth:`scan` runs over ``fold(text)`` and returns the detector classes
+    (``"brands"``, ``"models"``, ``"channels"``, ``"intent"``) with at least one
+    candidate match. Expressions are looser than the detectors' own regexes, so
+    a class missing from the result cannot match and its detector can be
+    skipped; classes that are present still go through the exact regex.
+    """
+
+    def __init__(self) -> None:
+        if hyperscan is None:
+            raise ImportError(
+                "hyperscan is required for DetectorPrefilter. Install with:  uv sync --extra fast"
+            )
+        sources: list[tuple[str, str]] = [
+            *(("brands", re.escape(a.casefold())) for v in BRAND_ALIASES.values() for a in v),
+            *(
+                ("models", re.escape(a.casefold()))
+                for _, _, aliases in MODEL_CATALOG.values()
+                for a in aliases
+            ),
+            *(("channels", re.escape(k)) for k in _KEYWORD_TO_CHANNEL),
+            *(("intent", _loosen(p)) for v in _INTENT_PATTERNS.values() for p in v),
+        ]
+        self._classes = [cls for cls, _ in sources]
+        flags = (
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[expr.encode() for _, expr in sources],
+            ids=list(range(len(sources))),
+            elements=len(sources),
+            flags=[flags] * len(sources),
+        )
+
+    def scan(self, folded: str) -> set[str]:
+        """Return the detector classes that may match the text *folded* came from."""
+        hits: set[str] = set()
+        classes = self._classes
+
+        def on_match(expr_id: int, _start: int, _end: int, _flags: int, _ctx: object) -> None:
+            hits.add(classes[expr_id])
+
+        try:
+            data = folded.encode()
+        except UnicodeEncodeError:
+            # Lone surrogates (JSON input can carry them) are not UTF-8: run every detector
+            return set(classes)
+        self._db.scan(data, match_event_handler=on_match)
+        return hits
+
+
+@functools.lru_cache(maxsize=1)
+def load_prefilter() -> DetectorPrefilter | None:
+    """Return the process-wide prefilter, or None when hyperscan is not installed."""
+    if hyperscan is None:
+        return None
+    return DetectorPrefilter()
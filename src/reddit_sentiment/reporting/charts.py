@@ -2,23 +2,48 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 
 from reddit_sentiment.analysis.brand_comparison import BrandMetrics
 from reddit_sentiment.analysis.channel_attribution import ChannelAttribution
 from reddit_sentiment.analysis.price_correlation import ModelSignal
 
+# Chart builders are memoised on a hashable snapshot of their inputs, so
+# re-rendering unchanged metrics (e.g. a dashboard refresh) skips figure
+# construction and serialisation. Results are immutable JSON strings.
+_CACHE_SIZE = 256
+
+# Sentiment colours: negative, neutral, positive
+_PALETTE = np.array(["#ef4444", "#94a3b8", "#22c55e"])
+
+
+def _colour(scores: np.ndarray) -> list[str]:
+    """Map scores to palette colours: > 0.05 positive, < -0.05 negative, else neutral."""
+    # 1 ± thresholds gives the palette index without per-element branches;
+    # NaN compares False both ways and lands on neutral
+    idx = 1 + (scores > 0.05).astype(np.intp) - (scores < -0.05)
+    return _PALETTE[idx].tolist()
+
 
 def brand_sentiment_bar(metrics: dict[str, BrandMetrics]) -> str:
     """Horizontal bar chart: avg sentiment per brand, coloured by label."""
     if not metrics:
         return "{}"
+    return _brand_sentiment_bar(tuple((m.brand, m.avg_hybrid_score) for m in metrics.values()))
 
-    brands = sorted(metrics.values(), key=lambda m: m.avg_hybrid_score, reverse=True)
-    names = [m.brand for m in brands]
-    scores = [m.avg_hybrid_score for m in brands]
-    colours = ["#22c55e" if s > 0.05 else "#ef4444" if s < -0.05 else "#94a3b8" for s in scores]
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _brand_sentiment_bar(rows: tuple[tuple[str, float], ...]) -> str:
+    brands = sorted(rows, key=lambda r: r[1], reverse=True)
+    names = [brand for brand, _ in brands]
+    scores = [score for _, score in brands]
+    colours = _colour(np.asarray(scores, dtype=np.float64))
 
     fig = go.Figure(
         go.Bar(
@@ -40,20 +65,31 @@ def brand_sentiment_bar(metrics: dict[str, BrandMetrics]) -> str:
         plot_bgcolor="white",
         paper_bgcolor="white",
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
 
 
 def sentiment_distribution_pie(metrics: dict[str, BrandMetrics]) -> str:
     """Stacked sentiment distribution for all brands combined."""
     if not metrics:
         return "{}"
-
-    pos = sum(m.positive_pct * m.mention_count for m in metrics.values()) / max(
-        sum(m.mention_count for m in metrics.values()), 1
-    )
-    neg = sum(m.negative_pct * m.mention_count for m in metrics.values()) / max(
-        sum(m.mention_count for m in metrics.values()), 1
+    return _sentiment_distribution_pie(
+        tuple((m.mention_count, m.positive_pct, m.negative_pct) for m in metrics.values())
     )
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _sentiment_distribution_pie(rows: tuple[tuple[int, float, float], ...]) -> str:
+    # Mention-weighted shares in a single pass
+    total = 0
+    pos_w = 0.0
+    neg_w = 0.0
+    for count, pos_pct, neg_pct in rows:
+        total += count
+        pos_w += pos_pct * count
+        neg_w += neg_pct * count
+    denom = max(total, 1)
+    pos = pos_w / denom
+    neg = neg_w / denom
     neu = 100 - pos - neg
 
     fig = go.Figure(
@@ -69,24 +105,24 @@ def sentiment_distribution_pie(metrics: dict[str, BrandMetrics]) -> str:
         height=350,
         margin=dict(l=20, r=20, t=60, b=20),
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
 
 
 def channel_share_pie(attribution: ChannelAttribution) -> str:
     """Pie chart of retail channel share."""
     if not attribution.channel_counts:
         return "{}"
+    return _channel_share_pie(tuple(attribution.channel_counts.items()))
 
-    # Collapse small channels into "Other"
-    sorted_ch = sorted(attribution.channel_counts.items(), key=lambda x: x[1], reverse=True)
-    labels, values = [], []
-    other = 0
-    for name, cnt in sorted_ch:
-        if len(labels) < 7:
-            labels.append(name)
-            values.append(cnt)
-        else:
-            other += cnt
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _channel_share_pie(counts: tuple[tuple[str, int], ...]) -> str:
+    # Collapse small channels into "Other"; top-k selection without a full sort
+    top = heapq.nlargest(7, counts, key=lambda x: x[1])
+    labels = [name for name, _ in top]
+    values = [cnt for _, cnt in top]
+    top_names = set(labels)
+    other = sum(cnt for name, cnt in counts if name not in top_names)
     if other:
         labels.append("Other")
         values.append(other)
@@ -103,7 +139,7 @@ def channel_share_pie(attribution: ChannelAttribution) -> str:
         height=380,
         margin=dict(l=20, r=20, t=60, b=20),
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
 
 
 def sentiment_trend_line(weekly_df: pd.DataFrame) -> str:
@@ -114,8 +150,10 @@ def sentiment_trend_line(weekly_df: pd.DataFrame) -> str:
     fig = go.Figure()
 
     if "brands" in weekly_df.columns:
-        for brand, grp in weekly_df.groupby("brands"):
-            grp = grp.sort_values("period")
+        # One sort up front; groups then come out already ordered by period,
+        # and sort=False keeps the (sorted) brand order without re-sorting keys
+        df_sorted = weekly_df.sort_values(["brands", "period"])
+        for brand, grp in df_sorted.groupby("brands", sort=False):
             fig.add_trace(go.Scatter(
                 x=grp["period"].tolist(),
                 y=grp["avg_sentiment"].tolist(),
@@ -144,14 +182,19 @@ def sentiment_trend_line(weekly_df: pd.DataFrame) -> str:
         plot_bgcolor="white",
         paper_bgcolor="white",
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
 
 
 def intent_funnel(attribution: ChannelAttribution) -> str:
     """Funnel chart of purchase intent stages."""
     if not attribution.intent_funnel:
         return "{}"
+    return _intent_funnel(tuple(attribution.intent_funnel.items()))
 
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _intent_funnel(counts: tuple[tuple[str, int], ...]) -> str:
+    funnel = dict(counts)
     # Ordered funnel stages
     stage_order = [
         "availability_info",
@@ -164,12 +207,12 @@ def intent_funnel(attribution: ChannelAttribution) -> str:
     ]
     labels, values = [], []
     for stage in stage_order:
-        if stage in attribution.intent_funnel:
+        if stage in funnel:
             labels.append(stage.replace("_", " ").title())
-            values.append(attribution.intent_funnel[stage])
+            values.append(funnel[stage])
 
     # Add any remaining stages not in our list
-    for stage, cnt in attribution.intent_funnel.items():
+    for stage, cnt in funnel.items():
         if stage not in stage_order:
             labels.append(stage.replace("_", " ").title())
             values.append(cnt)
@@ -180,57 +223,78 @@ def intent_funnel(attribution: ChannelAttribution) -> str:
         height=400,
         margin=dict(l=150, r=60, t=60, b=40),
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
 
 
 def model_mentions_bar(signals: list[ModelSignal]) -> str:
     """Horizontal bar: Reddit mention count per shoe model, coloured by sentiment."""
-    filtered = [s for s in signals if s.mention_count >= 3]
-    if not filtered:
+    rows = tuple(
+        (s.model, s.mention_count, s.avg_sentiment) for s in signals if s.mention_count >= 3
+    )
+    if not rows:
         return "{}"
-
-    filtered.sort(key=lambda s: s.mention_count)
-    names = [s.model for s in filtered]
-    counts = [s.mention_count for s in filtered]
-    colours = [
-        "#22c55e" if s.avg_sentiment > 0.05 else "#ef4444" if s.avg_sentiment < -0.05 else "#94a3b8"
-        for s in filtered
-    ]
-
+    return _model_mentions_bar(rows)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _model_mentions_bar(rows: tuple[tuple[str, int, float], ...]) -> str:
+    # Column arrays, ordered by mention count (stable, as sorted() was)
+    models, counts, sentiments = zip(*rows)
+    counts = np.asarray(counts, dtype=np.int64)
+    order = np.argsort(counts, kind="stable")
+    counts = counts[order]
+    sentiments = np.asarray(sentiments, dtype=np.float64)[order]
+    names = [models[i] for i in order.tolist()]
+    colours = _colour(sentiments)
+
+    # Arrays go to Plotly as lists: the HTML report's plotly.js predates the
+    # typed-array JSON encoding Plotly uses for NumPy input
     fig = go.Figure(go.Bar(
-        x=counts,
+        x=counts.tolist(),
         y=names,
         orientation="h",
         marker_color=colours,
-        text=[f"{s.avg_sentiment:+.2f}" for s in filtered],
+        text=[f"{s:+.2f}" for s in sentiments.tolist()],
         textposition="outside",
     ))
     fig.update_layout(
         title="Shoe Model Mentions (colour = sentiment)",
         xaxis_title="Reddit Mentions",
-        height=max(350, len(filtered) * 28),
+        height=max(350, len(names) * 28),
         margin=dict(l=160, r=80, t=60, b=40),
         plot_bgcolor="white",
         paper_bgcolor="white",
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
 
 
 def sentiment_price_scatter(signals: list[ModelSignal]) -> str:
     """Scatter: avg_sentiment (x) vs price_premium (y), bubble size = mentions."""
-    paired = [s for s in signals if s.num_sales > 0 and s.retail_price > 0]
-    if len(paired) < 3:
+    rows = tuple(
+        (s.model, s.avg_sentiment, s.price_premium, s.mention_count)
+        for s in signals
+        if s.num_sales > 0 and s.retail_price > 0
+    )
+    if len(rows) < 3:
         return "{}"
+    return _sentiment_price_scatter(rows)
+
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _sentiment_price_scatter(rows: tuple[tuple[str, float, float, int], ...]) -> str:
+    models, sentiments, premiums, counts = zip(*rows)
+    sentiments = np.asarray(sentiments, dtype=np.float64).tolist()
+    premiums = np.asarray(premiums, dtype=np.float64) * 100
+    sizes = np.clip(np.asarray(counts, dtype=np.float64) * 1.5, 8, 40)
     fig = go.Figure(go.Scatter(
-        x=[s.avg_sentiment for s in paired],
-        y=[s.price_premium * 100 for s in paired],
+        x=sentiments,
+        y=premiums.tolist(),
         mode="markers+text",
-        text=[s.model for s in paired],
+        text=list(models),
         textposition="top center",
         marker=dict(
-            size=[max(8, min(s.mention_count * 1.5, 40)) for s in paired],
-            color=[s.avg_sentiment for s in paired],
+            size=sizes.tolist(),
+            color=sentiments,
             colorscale="RdYlGn",
             cmin=-0.5,
             cmax=0.5,
@@ -248,4 +312,4 @@ def sentiment_price_scatter(signals: list[ModelSignal]) -> str:
         plot_bgcolor="white",
         paper_bgcolor="white",
     )
-    return fig.to_json()
+    return pio.to_json(fig, validate=False)
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from itertools import chain
 from pathlib import Path
 
 import pandas as pd
-from jinja2 import Environment, FileSystemLoader
+import pyarrow as pa
+import pyarrow.parquet as pq
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from markupsafe import Markup, escape
 
 from reddit_sentiment.analysis.brand_comparison import BrandComparisonAnalyzer
 from reddit_sentiment.analysis.channel_attribution import ChannelAttributionAnalyzer
@@ -25,6 +30,35 @@ from reddit_sentiment.reporting.charts import (
 
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Markdown table row formatters
+_BRAND_ROW = "| {} | {} | {} | {:+.4f} | {} | {:.1f}% | {:.1f}% |".format
+_CHANNEL_ROW = "| {} | {} | {:.1f}% |".format
+_COUNT_ROW = "| {} | {} |".format
+_THEME_ROW = "| {} | {} | {:.1f}% |".format
+
+# comparison_table() columns read by both brand-table renderers, in row order
+_BRAND_COLUMNS = ["brand", "mentions", "avg_sentiment", "sentiment", "positive_%", "negative_%"]
+
+# HTML brand-table row, pre-rendered so the template inserts one string
+_BRAND_HTML_ROW = (
+    "<tr>\n"
+    "          <td>{}</td>\n"
+    "          <td><strong>{}</strong></td>\n"
+    "          <td>{}</td>\n"
+    "          <td>{}</td>\n"
+    '          <td class="{}">{}</td>\n'
+    "          <td>{}%</td>\n"
+    "          <td>{}%</td>\n"
+    "        </tr>"
+).format
+
+
+def _brand_rows(brand_table: pd.DataFrame) -> Iterator[tuple]:
+    """Plain tuples of :data:`_BRAND_COLUMNS`, one per brand-table row (no dicts)."""
+    if brand_table.empty:
+        return iter(())
+    return brand_table[_BRAND_COLUMNS].itertuples(index=False, name=None)
+
 
 class ReportGenerator:
     """Orchestrates all analysis passes and renders HTML + Markdown reports."""
@@ -32,19 +66,61 @@ class ReportGenerator:
     def __init__(self, reports_dir: Path) -> None:
         self._reports_dir = reports_dir
         self._reports_dir.mkdir(parents=True, exist_ok=True)
+        # Templates ship with the package and never change at runtime: load and
+        # compile once, without per-render staleness checks. Compiled bytecode
+        # is also kept in Jinja's per-user temp-dir cache, so later processes
+        # skip parsing entirely. Values are escaped; chart JSON and pre-rendered
+        # rows are passed as safe markup.
         self._jinja = Environment(
             loader=FileSystemLoader(str(_TEMPLATES_DIR)),
-            autoescape=False,
+            autoescape=True,
+            cache_size=-1,
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(),
         )
+        self._template = self._jinja.get_template("report.html.j2")
+
+    @staticmethod
+    def _render_brand_rows(brand_table: pd.DataFrame) -> Markup:
+        """HTML ``<tr>`` rows for the brand table, built in one pass outside Jinja."""
+        return Markup("\n        ".join(
+            _BRAND_HTML_ROW(
+                rank,
+                escape(brand),
+                mentions,
+                round(avg, 4),
+                escape(label.lower()),
+                escape(label),
+                round(pos, 1),
+                round(neg, 1),
+            )
+            for rank, (brand, mentions, avg, label, pos, neg) in enumerate(
+                _brand_rows(brand_table), start=1
+            )
+        ))
 
     def _load_ebay_data(self) -> pd.DataFrame:
-        """Load latest eBay parquet if available, else return empty DataFrame."""
+        """Load latest eBay parquet if available, else return empty DataFrame.
+
+        Only the columns :class:`PriceCorrelationAnalyzer` reads are scanned.
+        """
+        return self._load_ebay_arrow().to_pandas(self_destruct=True)
+
+    def _load_ebay_arrow(self) -> pa.Table:
+        """Load the latest eBay parquet as an Arrow table (empty if there is none).
+
+        The file is memory-mapped and projected to the analyzer's columns;
+        :meth:`PriceCorrelationAnalyzer.analyze` aggregates it without a pandas copy.
+        """
         from reddit_sentiment.config import collection_config
         data_dir = collection_config.raw_data_dir
         files = sorted(data_dir.glob("ebay_*.parquet"), reverse=True)
-        if files:
-            return pd.read_parquet(files[0])
-        return pd.DataFrame()
+        if not files:
+            return pa.table({})
+        parquet = pq.ParquetFile(files[0], memory_map=True)
+        names = parquet.schema_arrow.names
+        columns = [c for c in PriceCorrelationAnalyzer.EBAY_COLUMNS if c in names]
+        return parquet.read(columns=columns, use_threads=True)
 
     def generate(self, df: pd.DataFrame, timestamp: str | None = None) -> tuple[Path, Path]:
         """Run analyses and write HTML + Markdown reports.
@@ -62,8 +138,7 @@ class ReportGenerator:
         # ------------------------------------------------------------------
         brand_analyzer = BrandComparisonAnalyzer()
         brand_metrics = brand_analyzer.compute(df)
-        brand_table_df = brand_analyzer.comparison_table(df)
-        brand_table = brand_table_df.to_dict("records") if not brand_table_df.empty else []
+        brand_table = brand_analyzer.comparison_table(df)
 
         channel_analyzer = ChannelAttributionAnalyzer()
         attribution = channel_analyzer.analyze(df)
@@ -79,23 +154,23 @@ class ReportGenerator:
         # ------------------------------------------------------------------
         total_records = len(df)
         total_posts = (
-            int((df["record_type"] == "post").sum())
+            int(df["record_type"].eq("post").to_numpy().sum())
             if "record_type" in df.columns
             else total_records
         )
         total_comments = total_records - total_posts
         brands_detected = len(brand_metrics)
         channels_detected = len(attribution.channel_counts)
-        intent_signals = sum(attribution.intent_funnel.values())
+        intent_signals = attribution.intent_signals
         avg_sentiment = float(df["hybrid_score"].mean()) if "hybrid_score" in df.columns else 0.0
-        subreddits = df["subreddit"].unique().tolist() if "subreddit" in df.columns else []
+        subreddit_count = df["subreddit"].nunique(dropna=False) if "subreddit" in df.columns else 0
 
         # ------------------------------------------------------------------
         # Price correlation (uses eBay data if available)
         # ------------------------------------------------------------------
         corr_analyzer = PriceCorrelationAnalyzer()
-        ebay_df = self._load_ebay_data()
-        corr_result = corr_analyzer.analyze(df, ebay_df)
+        ebay_table = self._load_ebay_arrow()
+        corr_result = corr_analyzer.analyze(df, ebay_table)
         corr_table = (
             corr_result.summary_df.to_dict("records")
             if not corr_result.summary_df.empty
@@ -116,8 +191,7 @@ class ReportGenerator:
         # ------------------------------------------------------------------
         # HTML report
         # ------------------------------------------------------------------
-        template = self._jinja.get_template("report.html.j2")
-        html_content = template.render(
+        html_content = self._template.render(
             report_date=report_date,
             total_records=total_records,
             total_posts=total_posts,
@@ -126,8 +200,8 @@ class ReportGenerator:
             channels_detected=channels_detected,
             intent_signals=intent_signals,
             avg_sentiment=avg_sentiment,
-            subreddits=subreddits,
-            brand_table=brand_table,
+            subreddit_count=subreddit_count,
+            brand_rows=self._render_brand_rows(brand_table),
             theme_counts=narrative.theme_counts,
             theme_pct=narrative.theme_percentages,
             top_tfidf=narrative.top_tfidf_terms,
@@ -143,7 +217,7 @@ class ReportGenerator:
             chart_scatter=chart_scatter,
             corr_table=corr_table,
             corr_coefficient=corr_result.correlation_sentiment_premium,
-            has_ebay_data=not ebay_df.empty,
+            has_ebay_data=ebay_table.num_rows > 0,
         )
         html_path = self._reports_dir / f"report_{timestamp}.html"
         html_path.write_text(html_content, encoding="utf-8")
@@ -177,11 +251,11 @@ class ReportGenerator:
         total_posts: int,
         total_comments: int,
         avg_sentiment: float,
-        brand_table: list[dict],
+        brand_table: pd.DataFrame,
         attribution,
         narrative,
     ) -> str:
-        lines = [
+        summary = (
             "# Reddit Sneaker Sentiment Report",
             "",
             f"Generated: {report_date}",
@@ -197,50 +271,59 @@ class ReportGenerator:
             "## Brand Rankings",
             "| Rank | Brand | Mentions | Avg Score | Sentiment | Positive% | Negative% |",
             "|------|-------|----------|-----------|-----------|-----------|-----------|",
-        ]
-        for i, row in enumerate(brand_table, 1):
-            lines.append(
-                f"| {i} | {row['brand']} | {row['mentions']} | "
-                f"{row['avg_sentiment']:+.4f} | {row['sentiment']} | "
-                f"{row['positive_%']:.1f}% | {row['negative_%']:.1f}% |"
+        )
+        brand_rows = (
+            _BRAND_ROW(i, *row)
+            for i, row in enumerate(_brand_rows(brand_table), 1)
+        )
+        channel_rows = (
+            _CHANNEL_ROW(
+                ch, attribution.channel_counts.get(ch, 0), attribution.channel_share.get(ch, 0)
+            )
+            for ch in attribution.top_channels
+        )
+        intent_rows = (
+            _COUNT_ROW(intent.replace("_", " ").title(), cnt)
+            for intent, cnt in sorted(
+                attribution.intent_funnel.items(), key=lambda x: x[1], reverse=True
+            )
+        )
+        theme_rows = (
+            _THEME_ROW(theme, cnt, narrative.theme_percentages.get(theme, 0))
+            for theme, cnt in sorted(
+                narrative.theme_counts.items(), key=lambda x: x[1], reverse=True
             )
+        )
+        tfidf = (
+            ("", f"**Top TF-IDF terms:** {', '.join(narrative.top_tfidf_terms[:20])}")
+            if narrative.top_tfidf_terms
+            else ()
+        )
 
-        lines += [
+        channel_head = (
             "",
             "## Top Retail Channels",
             "| Channel | Mentions | Share |",
             "|---------|----------|-------|",
-        ]
-        for ch in attribution.top_channels:
-            cnt = attribution.channel_counts.get(ch, 0)
-            share = attribution.channel_share.get(ch, 0)
-            lines.append(f"| {ch} | {cnt} | {share:.1f}% |")
-
-        lines += [
-            "",
-            "## Purchase Intent",
-            "| Intent | Count |",
-            "|--------|-------|",
-        ]
-        for intent, cnt in sorted(
-            attribution.intent_funnel.items(), key=lambda x: x[1], reverse=True
-        ):
-            lines.append(f"| {intent.replace('_', ' ').title()} | {cnt} |")
-
-        lines += [
+        )
+        intent_head = ("", "## Purchase Intent", "| Intent | Count |", "|--------|-------|")
+        theme_head = (
             "",
             "## Narrative Themes",
             "| Theme | Mentions | % |",
             "|-------|----------|---|",
-        ]
-        for theme, cnt in sorted(narrative.theme_counts.items(), key=lambda x: x[1], reverse=True):
-            pct = narrative.theme_percentages.get(theme, 0)
-            lines.append(f"| {theme} | {cnt} | {pct:.1f}% |")
-
-        if narrative.top_tfidf_terms:
-            lines += [
-                "",
-                f"**Top TF-IDF terms:** {', '.join(narrative.top_tfidf_terms[:20])}",
-            ]
-
-        return "\n".join(lines) + "\n"
+        )
+
+        # Every section is a lazy sequence of lines, joined in a single pass
+        sections = chain(
+            summary,
+            brand_rows,
+            channel_head,
+            channel_rows,
+            intent_head,
+            intent_rows,
+            theme_head,
+            theme_rows,
+            tfidf,
+        )
+        return "\n".join(sections) + "\n"
@@ -2,17 +2,38 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from reddit_sentiment.config import SentimentConfig
 from reddit_sentiment.detection.brands import BrandDetector, BrandMention
 from reddit_sentiment.detection.channels import ChannelDetector
-from reddit_sentiment.detection.intent import IntentResult, PurchaseIntentClassifier
+from reddit_sentiment.detection.intent import PurchaseIntentClassifier
 from reddit_sentiment.detection.models import ModelDetector
+from reddit_sentiment.detection.patterns import fold
+from reddit_sentiment.detection.prefilter import load_prefilter
 from reddit_sentiment.sentiment.vader import VaderAnalyzer
 
+# Frames smaller than this are annotated in-process; worker start-up costs more
+_PARALLEL_MIN_ROWS = 1000
+
+# Per-worker pipeline for annotate_parallel, built once by _init_worker
+_worker_pipeline: SentimentPipeline | None = None
+
+
+def _init_worker(use_transformer: bool) -> None:
+    global _worker_pipeline
+    # Workers already split the rows; VADER must not start a pool of its own
+    _worker_pipeline = SentimentPipeline(use_transformer=use_transformer, vader_jobs=1)
+
+
+def _annotate_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    return _worker_pipeline.annotate(df)  # type: ignore[union-attr]
+
 
 @dataclass
 class TextAnnotation:
@@ -32,21 +53,38 @@ class TextAnnotation:
 class SentimentPipeline:
     """Orchestrates detection + VADER + optional transformer scoring."""
 
-    def __init__(self, use_transformer: bool = True) -> None:
+    def __init__(self, use_transformer: bool = True, vader_jobs: int | None = None) -> None:
         cfg = SentimentConfig()
         self._transformer_weight = cfg.transformer_weight
         self._vader_weight = cfg.vader_weight
-        self._use_transformer = use_transformer
+        # A zero blend weight makes transformer scores dead weight: skip contexts and model
+        self._use_transformer = use_transformer and self._transformer_weight > 0.0
+        self._skip_vader_abs = cfg.transformer_skip_vader_abs
 
         self._vader = VaderAnalyzer()
+        # Worker processes for every VADER batch; None = in-process
+        self._vader_jobs = vader_jobs
         self._brand_detector = BrandDetector()
         self._model_detector = ModelDetector()
         self._channel_detector = ChannelDetector()
         self._intent_clf = PurchaseIntentClassifier()
+        # One Hyperscan pass per text to skip detectors that cannot match;
+        # None (hyperscan not installed) runs every detector
+        self._prefilter = load_prefilter()
 
         # Lazy-load transformer only when needed
         self._transformer = None
 
+    def __enter__(self) -> SentimentPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the VADER worker pool, if a large batch started one."""
+        self._vader.close()
+
     def _get_transformer(self):
         if self._transformer is None:
             from reddit_sentiment.sentiment.transformer import TransformerAnalyzer
@@ -54,42 +92,96 @@ class SentimentPipeline:
             self._transformer = TransformerAnalyzer()
         return self._transformer
 
+    def _detect_all(
+        self, text: str, urls: list[str]
+    ) -> tuple[list[BrandMention], list[str], list[str], str]:
+        """Run the per-text detectors over one text, folding it once for them and intent.
+
+        Returns brand mentions, models, channels and the folded text for
+        :meth:`PurchaseIntentClassifier.classify_batch` ("" when the prefilter
+        rules intent out).
+        """
+        folded = fold(text)
+        hits = self._prefilter.scan(folded) if self._prefilter is not None else None
+        # Context windows are only consumed by the transformer pass
+        mentions = (
+            self._brand_detector.detect(text, context=self._use_transformer, folded=folded)
+            if hits is None or "brands" in hits
+            else []
+        )
+        models = (
+            self._model_detector.detect_models(text) if hits is None or "models" in hits else []
+        )
+        # URL domains are not covered by the prefilter; only the keyword scan is skipped
+        channels = self._channel_detector.detect(
+            text if hits is None or "channels" in hits else "", urls
+        )
+        intent_folded = folded if hits is None or "intent" in hits else ""
+        return mentions, models, channels, intent_folded
+
     def annotate(self, df: pd.DataFrame) -> pd.DataFrame:
         """Annotate a DataFrame that has 'full_text', 'id', 'extracted_urls' columns.
 
-        Returns the input DataFrame with additional columns added in-place.
+        Returns a new DataFrame with the annotation columns added; the input's own
+        columns are shared with it rather than copied.
         """
-        df = df.copy()
         texts = df["full_text"].fillna("").tolist()
         urls_col = (
             df["extracted_urls"].tolist() if "extracted_urls" in df.columns else [[] for _ in texts]
         )
 
         # ------------------------------------------------------------------
-        # 1. VADER scores for all texts (fast)
+        # 1. VADER scores for all texts (fast). Scored on the calling thread:
+        #    large batches fork a worker pool, which must not happen from a
+        #    background thread while detection runs
         # ------------------------------------------------------------------
-        vader_scores = self._vader.score_batch(texts)
+        vader_scores = self._vader.score_batch(texts, self._vader_jobs)
 
         # ------------------------------------------------------------------
-        # 2. Brand detection → collect brand-context windows for transformer
+        # 2. Detection (one pass per text) → brand-context windows for transformer
         # ------------------------------------------------------------------
         all_mentions: list[list[BrandMention]] = []
+        model_lists: list[list[str]] = []
+        channel_lists: list[list[str]] = []
+        intent_texts: list[str] = []
+        intent_folded: list[str] = []
         brand_contexts: list[str] = []
         context_text_indices: list[int] = []  # which row each context belongs to
 
-        for i, text in enumerate(texts):
-            mentions = self._brand_detector.detect(text)
+        for i, (text, urls) in enumerate(zip(texts, urls_col)):
+            mentions, models, channels, folded = self._detect_all(
+                text, urls if isinstance(urls, list) else []
+            )
             all_mentions.append(mentions)
+            model_lists.append(models)
+            channel_lists.append(channels)
+            intent_texts.append(text if folded else "")
+            intent_folded.append(folded)
             for mention in mentions:
                 brand_contexts.append(mention.context)
                 context_text_indices.append(i)
 
+        # Intent over the whole batch: one literal lookup per distinct keyword
+        intent_results = self._intent_clf.classify_batch(intent_texts, intent_folded)
+        intent_primaries = [r.primary_intent for r in intent_results]
+        all_intents_col = [r.all_intents for r in intent_results]
+
         # ------------------------------------------------------------------
         # 3. Transformer on brand contexts (if enabled + available)
         # ------------------------------------------------------------------
         context_transformer_scores: list[float] = []
         transformer_available = False
 
+        if self._use_transformer and self._skip_vader_abs is not None:
+            # Confident VADER rows keep their VADER score; only the rest reach the model
+            kept = [
+                j
+                for j, row in enumerate(context_text_indices)
+                if abs(vader_scores[row]) < self._skip_vader_abs
+            ]
+            brand_contexts = [brand_contexts[j] for j in kept]
+            context_text_indices = [context_text_indices[j] for j in kept]
+
         if self._use_transformer and brand_contexts:
             try:
                 transformer = self._get_transformer()
@@ -97,66 +189,59 @@ class SentimentPipeline:
                 transformer_available = True
             except ImportError:
                 # Fall back to VADER for contexts too
-                context_transformer_scores = self._vader.score_batch(brand_contexts)
+                context_transformer_scores = self._vader.score_batch(
+                    brand_contexts, self._vader_jobs
+                )
 
         # ------------------------------------------------------------------
-        # 4. Per-row aggregation
+        # 4. Per-row aggregation (column arrays, not per-row objects)
         # ------------------------------------------------------------------
-        transformer_scores: list[float | None] = []
-        hybrid_scores: list[float] = []
-        brand_lists: list[list[str]] = []
-        model_lists: list[list[str]] = []
-        channel_lists: list[list[str]] = []
-        intent_primaries: list[str | None] = []
-        all_intents_col: list[list[str]] = []
-
-        # Build per-text transformer scores by averaging over brand contexts
-        text_transformer_scores: dict[int, list[float]] = {}
-        for ctx_idx, row_idx in enumerate(context_text_indices):
-            score = context_transformer_scores[ctx_idx] if context_transformer_scores else 0.0
-            text_transformer_scores.setdefault(row_idx, []).append(score)
-
-        for i, (text, vader, urls) in enumerate(zip(texts, vader_scores, urls_col)):
-            # Transformer: average of brand-context scores for this row
-            t_scores = text_transformer_scores.get(i, [])
-            if t_scores and transformer_available:
-                t_score: float | None = sum(t_scores) / len(t_scores)
-            else:
-                t_score = None
-
-            # Hybrid blend
-            if t_score is not None:
-                hybrid = self._transformer_weight * t_score + self._vader_weight * vader
-            else:
-                hybrid = vader
-
-            # Brand names
-            brands = list({m.brand for m in all_mentions[i]})
-
-            # Shoe models
-            models = self._model_detector.detect_models(text)
-
-            # Channels
-            channels = self._channel_detector.detect(text, urls if isinstance(urls, list) else [])
-
-            # Intent
-            intent_result: IntentResult = self._intent_clf.classify(text)
-
-            transformer_scores.append(t_score)
-            hybrid_scores.append(hybrid)
-            brand_lists.append(brands)
-            model_lists.append(models)
-            channel_lists.append(channels)
-            intent_primaries.append(intent_result.primary_intent)
-            all_intents_col.append(intent_result.all_intents)
-
-        df["vader_score"] = vader_scores
-        df["transformer_score"] = transformer_scores
-        df["hybrid_score"] = hybrid_scores
-        df["brands"] = brand_lists
-        df["models"] = model_lists
-        df["channels"] = channel_lists
-        df["primary_intent"] = intent_primaries
-        df["all_intents"] = all_intents_col
-
-        return df
+        vader_arr = np.asarray(vader_scores, dtype=np.float64)
+        if transformer_available:
+            # Transformer: mean of brand-context scores per row, NaN for rows without any
+            rows = np.asarray(context_text_indices, dtype=np.intp)
+            sums = np.bincount(rows, weights=context_transformer_scores, minlength=len(texts))
+            counts = np.bincount(rows, minlength=len(texts))
+            with np.errstate(invalid="ignore"):
+                t_mean = sums / counts
+            transformer_col: np.ndarray | None = t_mean
+            hybrid = np.where(
+                np.isnan(t_mean),
+                vader_arr,
+                self._transformer_weight * t_mean + self._vader_weight * vader_arr,
+            )
+        else:
+            transformer_col = None
+            hybrid = vader_arr
+
+        brand_lists = [list({m.brand for m in mentions}) for mentions in all_mentions]
+
+        return df.assign(
+            vader_score=vader_arr,
+            transformer_score=transformer_col,
+            hybrid_score=hybrid,
+            brands=brand_lists,
+            models=model_lists,
+            channels=channel_lists,
+            primary_intent=intent_primaries,
+            all_intents=all_intents_col,
+        )
+
+    def annotate_parallel(self, df: pd.DataFrame, n_jobs: int | None = None) -> pd.DataFrame:
+        """Like :meth:`annotate`, with the rows split across *n_jobs* worker processes.
+
+        Each worker builds its own pipeline once and annotates one contiguous
+        slice; the slices are concatenated back in order. Frames below 1000
+        rows, or ``n_jobs=1``, run :meth:`annotate` in-process. Meant for
+        VADER-only runs: with the transformer, every worker loads its own model.
+        """
+        n_jobs = n_jobs or os.cpu_count() or 1
+        if n_jobs == 1 or len(df) < _PARALLEL_MIN_ROWS:
+            return self.annotate(df)
+
+        size = -(-len(df) // n_jobs)  # ceil: one slice per worker
+        chunks = [df.iloc[i : i + size] for i in range(0, len(df), size)]
+        with ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=(self._use_transformer,)
+        ) as pool:
+            return pd.concat(pool.map(_annotate_chunk, chunks))
@@ -4,12 +4,19 @@ Requires the [ml] optional extra:
     uv sync --extra ml
 
 Falls back gracefully with ImportError if torch/transformers are not installed.
+
+With ``SENTIMENT_USE_ONNX=true`` the model is exported to ONNX once, quantized
+to int8 and run on onnxruntime's CPU provider; this needs ``optimum[onnxruntime]``.
 """
 
 from __future__ import annotations
 
+import functools
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     pass  # avoid heavy imports at type-check time
 
@@ -33,7 +40,9 @@ class TransformerAnalyzer:
     """Score short text snippets using a fine-tuned Twitter sentiment model.
 
     The model outputs three logits (negative / neutral / positive) mapped to a
-    float score in [-1, 1]:  score = P(positive) - P(negative).
+    float score in [-1, 1]:  score = P(positive) - P(negative). Texts are
+    tokenized and run as padded batches straight through the model (BF16/FP16
+    on GPU), with the softmax and difference taken on the whole batch tensor.
 
     On machines without torch/transformers installed the class can still be
     instantiated; calling ``score`` / ``score_batch`` will raise ``ImportError``
@@ -46,63 +55,146 @@ class TransformerAnalyzer:
         cfg = SentimentConfig()
         self._model_name = model_name or cfg.transformer_model
         self._batch_size = cfg.transformer_batch_size
-        self._pipeline = None  # lazy-loaded on first use
+        self._use_onnx = cfg.use_onnx
+        self._onnx_dir = cfg.onnx_model_dir / self._model_name.replace("/", "--")
+        # Lazy-loaded on first use
+        self._tokenizer = None
+        self._model = None
+        self._device = "cpu"
+        self._pos_idx: int | None = 2
+        self._neg_idx: int | None = 0
 
     def _load(self) -> None:
-        if self._pipeline is not None:
+        if self._model is not None:
             return
         if not _check_ml():
             raise ImportError(
                 "torch and transformers are required for TransformerAnalyzer. "
                 "Install with:  uv sync --extra ml"
             )
-        from transformers import pipeline  # type: ignore[import]
-
-        self._pipeline = pipeline(
-            "sentiment-analysis",
-            model=self._model_name,
-            tokenizer=self._model_name,
-            top_k=None,  # return all label scores
-            truncation=True,
-            max_length=512,
-        )
-
-    def _labels_to_score(self, label_scores: list[dict]) -> float:
-        """Convert [{label, score}, ...] → float in [-1, 1]."""
-        mapping: dict[str, float] = {}
-        for item in label_scores:
-            label: str = item["label"].lower()
-            if "positive" in label or label == "pos" or label == "label_2":
-                mapping["positive"] = item["score"]
-            elif "negative" in label or label == "neg" or label == "label_0":
-                mapping["negative"] = item["score"]
-            else:
-                mapping["neutral"] = item["score"]
-        pos = mapping.get("positive", 0.0)
-        neg = mapping.get("negative", 0.0)
-        return float(pos - neg)
+        # Weights are shared by every analyzer for the same model in this process
+        (
+            self._tokenizer,
+            self._model,
+            self._device,
+            self._pos_idx,
+            self._neg_idx,
+        ) = _load_weights(self._model_name, self._use_onnx, self._onnx_dir)
+
+    def _score_chunk(self, texts: list[str]) -> list[float]:
+        """Run one padded batch through the model; returns P(positive) - P(negative)."""
+        import torch  # type: ignore[import]
+
+        enc = self._tokenizer(  # type: ignore[misc]
+            texts, padding=True, truncation=True, max_length=512, return_tensors="pt"
+        ).to(self._device)
+        with torch.inference_mode():
+            probs = self._model(**enc).logits.softmax(-1)  # type: ignore[misc]
+            # A label the model does not have contributes probability 0
+            scores = probs.new_zeros(probs.shape[0])
+            if self._pos_idx is not None:
+                scores += probs[:, self._pos_idx]
+            if self._neg_idx is not None:
+                scores -= probs[:, self._neg_idx]
+        return scores.float().cpu().tolist()
 
     def score(self, text: str) -> float:
         """Score a single text snippet; returns float in [-1, 1]."""
         if not text or not text.strip():
             return 0.0
-        self._load()
-        result = self._pipeline([text])  # type: ignore[misc]
-        return self._labels_to_score(result[0])
+        return self.score_batch([text])[0]
+
+    def score_batch(self, texts: list[str], batch_size: int | None = None) -> list[float]:
+        """Score a batch of texts in padded model batches of *batch_size*.
 
-    def score_batch(self, texts: list[str]) -> list[float]:
-        """Score a batch of texts (uses pipeline batching for efficiency)."""
+        *batch_size* defaults to the configured ``transformer_batch_size``.
+        Empty texts score 0.0 without reaching the model. The rest are batched
+        in length order so each batch pads to similar lengths.
+        """
         if not texts:
             return []
         self._load()
-        # Filter empties, preserving index
-        scores = []
-        non_empty = [(i, t) for i, t in enumerate(texts) if t and t.strip()]
-        results = self._pipeline(  # type: ignore[misc]
-            [t for _, t in non_empty],
-            batch_size=self._batch_size,
+        batch_size = batch_size or self._batch_size
+        # Empties keep their preallocated 0.0; each batch is written back by index
+        scores = np.zeros(len(texts))
+        non_empty = np.fromiter((i for i, t in enumerate(texts) if t and t.strip()), dtype=np.intp)
+        lengths = np.fromiter((len(texts[i]) for i in non_empty), dtype=np.intp)
+        non_empty = non_empty[np.argsort(lengths, kind="stable")]
+        for start in range(0, len(non_empty), batch_size):
+            chunk = non_empty[start : start + batch_size]
+            scores[chunk] = self._score_chunk([texts[i] for i in chunk])
+        return scores.tolist()
+
+
+@functools.cache
+def _load_weights(model_name: str, use_onnx: bool, onnx_dir: Path) -> tuple:
+    """Load (tokenizer, model, device, pos_idx, neg_idx) for *model_name*, once per process."""
+    import torch  # type: ignore[import]
+    from transformers import (  # type: ignore[import]
+        AutoModelForSequenceClassification,
+        AutoTokenizer,
+    )
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    device = "cpu"
+    if use_onnx:
+        # int8 ONNX Runtime session on CPU; takes the same torch inputs
+        model = _load_onnx_int8(model_name, onnx_dir)
+    else:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        # Half precision only pays off (and is only well supported) on GPU; bf16
+        # where the card supports it: same speed as fp16, with fp32 range
+        if device == "cuda":
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        else:
+            dtype = torch.float32
+        model = (
+            AutoModelForSequenceClassification.from_pretrained(model_name, torch_dtype=dtype)
+            .to(device)
+            .eval()
         )
-        idx_map = {i: self._labels_to_score(r) for (i, _), r in zip(non_empty, results)}
-        for i in range(len(texts)):
-            scores.append(idx_map.get(i, 0.0))
-        return scores
+    pos_idx, neg_idx = _label_indices(model.config.id2label)
+    return tokenizer, model, device, pos_idx, neg_idx
+
+
+def _label_indices(id2label: dict[int, str]) -> tuple[int | None, int | None]:
+    """Return the (positive, negative) logit indices from a model's ``id2label``.
+
+    Accepts named labels ("positive", "neg", ...) and the generic
+    ``LABEL_0``/``LABEL_2`` of three-class checkpoints. A label the model does
+    not have is ``None``.
+    """
+    pos_idx: int | None = None
+    neg_idx: int | None = None
+    for idx, label in id2label.items():
+        label = label.lower()
+        if "positive" in label or label == "pos" or label == "label_2":
+            pos_idx = int(idx)
+        elif "negative" in label or label == "neg" or label == "label_0":
+            neg_idx = int(idx)
+    return pos_idx, neg_idx
+
+
+def _load_onnx_int8(model_name: str, onnx_dir: Path):
+    """Load an int8 ONNX Runtime model for *model_name*, exporting it on first use.
+
+    The FP32 export and its dynamically quantized copy are kept in *onnx_dir*,
+    so later loads skip both steps.
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore[import]
+        from optimum.onnxruntime import ORTModelForSequenceClassification  # type: ignore[import]
+    except ImportError as exc:
+        raise ImportError(
+            "optimum[onnxruntime] is required when SENTIMENT_USE_ONNX is set. "
+            "Install with:  uv pip install 'optimum[onnxruntime]'"
+        ) from exc
+
+    quantized = onnx_dir / "model_quantized.onnx"
+    if not quantized.exists():
+        exported = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        exported.save_pretrained(onnx_dir)
+        quantize_dynamic(onnx_dir / "model.onnx", quantized, weight_type=QuantType.QInt8)
+    return ORTModelForSequenceClassification.from_pretrained(
+        onnx_dir, file_name=quantized.name, provider="CPUExecutionProvider"
+    )
@@ -2,27 +2,103 @@
 
 from __future__ import annotations
 
+import functools
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+# Batches smaller than this are scored in-process; worker start-up costs more
+_PARALLEL_MIN_TEXTS = 1000
+# Distinct texts whose scores are memoized per process (crossposts, bot replies)
+_SCORE_CACHE_SIZE = 10_000
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_analyzer() -> SentimentIntensityAnalyzer:
+    """Process-wide VADER analyzer; the lexicon is loaded once however many wrappers exist."""
+    return SentimentIntensityAnalyzer()
+
+
+@functools.lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _polarity_scores(text: str) -> dict[str, float]:
+    """Memoized VADER scores; callers must not mutate the returned dict."""
+    return _shared_analyzer().polarity_scores(text)
+
+
+def _compound(text: str) -> float:
+    if not text or not text.strip():
+        return 0.0
+    return _polarity_scores(text)["compound"]
+
+
+def _init_worker() -> None:
+    # Each worker loads its own lexicon up front, so the analyzer is never pickled
+    _shared_analyzer()
+
+
+def _score_chunk(texts: list[str]) -> list[float]:
+    return [_compound(t) for t in texts]
+
 
 class VaderAnalyzer:
-    """Thin wrapper around VaderSentiment for batch text analysis."""
+    """Thin wrapper around VaderSentiment for batch text analysis.
+
+    Batches run in-process unless a caller asks for worker processes. The
+    worker pool then lives until :meth:`close` (or until the analyzer is
+    garbage-collected); use the analyzer as a context manager to release it.
+    """
 
     def __init__(self) -> None:
-        self._analyzer = SentimentIntensityAnalyzer()
+        # Worker pool for large batches, created on first use and reused
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_size = 0
+        self._finalizer: weakref.finalize | None = None
 
     def score(self, text: str) -> float:
         """Return compound score in [-1, 1]."""
-        if not text or not text.strip():
-            return 0.0
-        return self._analyzer.polarity_scores(text)["compound"]
+        return _compound(text)
+
+    def score_batch(self, texts: list[str], n_jobs: int | None = None) -> list[float]:
+        """Score a list of texts; returns compound scores.
+
+        With *n_jobs* > 1, batches of at least 1000 texts are split across
+        that many worker processes. The default, and smaller batches, run
+        in-process.
+        """
+        if not n_jobs or n_jobs == 1 or len(texts) < _PARALLEL_MIN_TEXTS:
+            return _score_chunk(texts)
+
+        pool = self._get_pool(n_jobs)
+        size = -(-len(texts) // n_jobs)  # ceil: one chunk per worker
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+        return [score for chunk in pool.map(_score_chunk, chunks) for score in chunk]
+
+    def _get_pool(self, n_jobs: int) -> ProcessPoolExecutor:
+        if self._pool is None or self._pool_size != n_jobs:
+            self.close()
+            self._pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker)
+            self._pool_size = n_jobs
+            # Shuts the workers down if the analyzer is dropped without close()
+            self._finalizer = weakref.finalize(self, self._pool.shutdown)
+        return self._pool
+
+    def __enter__(self) -> VaderAnalyzer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
-    def score_batch(self, texts: list[str]) -> list[float]:
-        """Score a list of texts; returns compound scores."""
-        return [self.score(t) for t in texts]
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+            self._pool = None
+            self._pool_size = 0
 
     def full_scores(self, text: str) -> dict[str, float]:
         """Return all VADER scores (neg, neu, pos, compound)."""
         if not text or not text.strip():
             return {"neg": 0.0, "neu": 1.0, "pos": 0.0, "compound": 0.0}
-        return self._analyzer.polarity_scores(text)
+        return dict(_polarity_scores(text))
@@ -126,3 +126,18 @@ def test_min_mentions_default_is_five(analyzer):
     df = _make_df(rows)
     result = analyzer.compute(df)  # default min_mentions=5
     assert "Nike" not in result  # only 4 mentions → filtered
+
+
+def test_per_brand_aggregates(analyzer):
+    nike = analyzer.compute(_sample_df(), min_mentions=1)["Nike"]
+    assert nike.avg_hybrid_score == pytest.approx(0.4)
+    assert nike.positive_pct == 100.0
+    assert nike.avg_post_score == pytest.approx(170 / 3)
+    assert nike.top_subreddits == ["Sneakers"]
+
+
+def test_missing_score_and_subreddit_columns(analyzer):
+    df = _sample_df().drop(columns=["score", "subreddit"])
+    adidas = analyzer.compute(df, min_mentions=1)["Adidas"]
+    assert adidas.avg_post_score == 0.0
+    assert adidas.top_subreddits == []
@@ -3,7 +3,10 @@
 import pandas as pd
 import pytest
 
-from reddit_sentiment.analysis.channel_attribution import ChannelAttributionAnalyzer
+from reddit_sentiment.analysis.channel_attribution import (
+    ChannelAttribution,
+    ChannelAttributionAnalyzer,
+)
 
 
 @pytest.fixture
@@ -58,6 +61,16 @@ def test_intent_funnel(analyzer):
     assert result.intent_funnel.get("seeking_purchase", 0) == 1
 
 
+def test_intent_signals_counts_rows_with_intent(analyzer):
+    result = analyzer.analyze(_sample_df())
+    assert result.intent_signals == 3 == sum(result.intent_funnel.values())
+
+
+def test_intent_signals_defaults_to_funnel_total():
+    attribution = ChannelAttribution({}, {}, {}, {"selling": 2, "marketplace": 1})
+    assert attribution.intent_signals == 3
+
+
 def test_channel_by_brand(analyzer):
     df = _sample_df()
     result = analyzer.analyze(df)
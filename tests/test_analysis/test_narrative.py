@@ -6,7 +6,7 @@ import pytest
 from reddit_sentiment.analysis.narrative import THEME_KEYWORDS, NarrativeThemeExtractor
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def extractor():
     return NarrativeThemeExtractor()
 
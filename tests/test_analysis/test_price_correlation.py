@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from reddit_sentiment.analysis.price_correlation import (
     CorrelationResult,
+    ModelSignal,
     PriceCorrelationAnalyzer,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def analyzer():
     return PriceCorrelationAnalyzer()
 
@@ -30,6 +32,10 @@ def _ebay_df(rows: list[dict]) -> pd.DataFrame:
     return pd.DataFrame(rows)
 
 
+def _by_model(result: CorrelationResult) -> dict[str, ModelSignal]:
+    return {s.model: s for s in result.signals}
+
+
 def _reddit_row(models: list[str], hybrid_score: float = 0.3) -> dict:
     return {"models": models, "hybrid_score": hybrid_score}
 
@@ -38,6 +44,10 @@ def _reddit_row(models: list[str], hybrid_score: float = 0.3) -> dict:
 _AJ1_ROWS = [_reddit_row(["Air Jordan 1"], score) for score in [0.5, 0.6, 0.4]]
 _DUNK_ROWS = [_reddit_row(["Dunk Low"], score) for score in [-0.1, -0.2, -0.15]]
 
+# Built once and shared: analyze() never mutates its inputs
+_AJ1_DF = _reddit_df(_AJ1_ROWS)
+_AJ1_DUNK_DF = _reddit_df(_AJ1_ROWS + _DUNK_ROWS)
+
 
 # ---------------------------------------------------------------------------
 # Empty / missing data
@@ -58,10 +68,10 @@ def test_missing_models_column_returns_no_signals(analyzer):
 
 
 def test_empty_ebay_df_still_returns_reddit_signals(analyzer):
-    df = _reddit_df(_AJ1_ROWS)
+    df = _AJ1_DF
     result = analyzer.analyze(df, pd.DataFrame())
     assert len(result.signals) >= 1
-    aj1 = next((s for s in result.signals if s.model == "Air Jordan 1"), None)
+    aj1 = _by_model(result).get("Air Jordan 1")
     assert aj1 is not None
     assert aj1.num_sales == 0  # no eBay data
     assert aj1.avg_sold_price == 0.0
@@ -93,7 +103,7 @@ def test_sentiment_aggregated_correctly(analyzer):
         _reddit_row(["Air Jordan 1"], 0.2),
     ]
     result = analyzer.analyze(_reddit_df(rows), pd.DataFrame())
-    aj1 = next(s for s in result.signals if s.model == "Air Jordan 1")
+    aj1 = _by_model(result)["Air Jordan 1"]
     assert aj1.avg_sentiment == pytest.approx(0.4, abs=1e-4)
 
 
@@ -104,7 +114,7 @@ def test_positive_pct_computed(analyzer):
         _reddit_row(["Dunk Low"], -0.3),  # negative
     ]
     result = analyzer.analyze(_reddit_df(rows), pd.DataFrame())
-    dunk = next(s for s in result.signals if s.model == "Dunk Low")
+    dunk = _by_model(result)["Dunk Low"]
     assert dunk.positive_pct == pytest.approx(100 / 3, rel=0.01)
 
 
@@ -127,13 +137,13 @@ def test_signals_sorted_by_mention_count(analyzer):
 
 
 def test_ebay_prices_joined(analyzer):
-    reddit = _reddit_df(_AJ1_ROWS)
+    reddit = _AJ1_DF
     ebay = _ebay_df([
         {"model": "Air Jordan 1", "sold_price_usd": 300.0},
         {"model": "Air Jordan 1", "sold_price_usd": 360.0},
     ])
     result = analyzer.analyze(reddit, ebay)
-    aj1 = next(s for s in result.signals if s.model == "Air Jordan 1")
+    aj1 = _by_model(result)["Air Jordan 1"]
     assert aj1.num_sales == 2
     assert aj1.avg_sold_price == pytest.approx(330.0)
     assert aj1.min_sold_price == pytest.approx(300.0)
@@ -142,14 +152,14 @@ def test_ebay_prices_joined(analyzer):
 
 def test_price_premium_computed(analyzer):
     """Air Jordan 1 retail = $180; avg sold $270 → premium = 0.5 (50%)."""
-    reddit = _reddit_df(_AJ1_ROWS)
+    reddit = _AJ1_DF
     ebay = _ebay_df([
         {"model": "Air Jordan 1", "sold_price_usd": 270.0},
         {"model": "Air Jordan 1", "sold_price_usd": 270.0},
         {"model": "Air Jordan 1", "sold_price_usd": 270.0},
     ])
     result = analyzer.analyze(reddit, ebay)
-    aj1 = next(s for s in result.signals if s.model == "Air Jordan 1")
+    aj1 = _by_model(result)["Air Jordan 1"]
     assert aj1.price_premium == pytest.approx(0.5, rel=0.01)
 
 
@@ -159,12 +169,12 @@ def test_price_premium_computed(analyzer):
 
 
 def test_correlation_none_without_ebay(analyzer):
-    result = analyzer.analyze(_reddit_df(_AJ1_ROWS + _DUNK_ROWS), pd.DataFrame())
+    result = analyzer.analyze(_AJ1_DUNK_DF, pd.DataFrame())
     assert result.correlation_sentiment_premium is None
 
 
 def test_correlation_none_with_fewer_than_3_paired(analyzer):
-    reddit = _reddit_df(_AJ1_ROWS + _DUNK_ROWS)
+    reddit = _AJ1_DUNK_DF
     ebay = _ebay_df([{"model": "Air Jordan 1", "sold_price_usd": 300.0}])
     result = analyzer.analyze(reddit, ebay)
     # Only one model has eBay data → <3 pairs → None
@@ -177,7 +187,7 @@ def test_correlation_none_with_fewer_than_3_paired(analyzer):
 
 
 def test_summary_df_columns(analyzer):
-    result = analyzer.analyze(_reddit_df(_AJ1_ROWS), pd.DataFrame())
+    result = analyzer.analyze(_AJ1_DF, pd.DataFrame())
     expected_cols = {
         "model", "brand", "retail_price", "mentions",
         "avg_sentiment", "positive_%", "negative_%",
@@ -189,3 +199,23 @@ def test_summary_df_columns(analyzer):
 def test_summary_df_empty_when_no_signals(analyzer):
     result = analyzer.analyze(pd.DataFrame(), pd.DataFrame())
     assert result.summary_df.empty
+
+
+def test_ebay_arrow_table_matches_dataframe(analyzer):
+    reddit = _AJ1_DUNK_DF
+    listings = {
+        "model": ["Air Jordan 1", "Air Jordan 1", "Air Jordan 1", "Dunk Low", None],
+        "sold_price_usd": [300.0, float("nan"), 361.0, 140.0, 99.0],
+    }
+    from_pandas = analyzer.analyze(reddit, pd.DataFrame(listings))
+    from_arrow = analyzer.analyze(reddit, pa.table(listings))
+    assert from_arrow.signals == from_pandas.signals
+    aj1 = _by_model(from_arrow)["Air Jordan 1"]
+    assert (aj1.num_sales, aj1.avg_sold_price) == (2, 330.5)
+
+
+def test_analyze_does_not_mutate_shared_frames(analyzer):
+    before = _AJ1_DUNK_DF.copy()
+    analyzer.analyze(_AJ1_DUNK_DF, pd.DataFrame())
+    analyzer.analyze_brand_level(_AJ1_DUNK_DF)
+    pd.testing.assert_frame_equal(_AJ1_DUNK_DF, before)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
@@ -15,54 +16,63 @@ from reddit_sentiment.api.app import app
 # ---------------------------------------------------------------------------
 
 SAMPLE_ROWS = [
-    {
-        "id": f"t3_{i}",
-        "subreddit": sub,
-        "record_type": rtype,
-        "score": 100,
-        "created_utc": pd.Timestamp("2026-01-15", tz="UTC") + pd.Timedelta(days=i),
-        "full_text": text,
-        "vader_score": sent,
-        "hybrid_score": sent,
-        "transformer_score": None,
-        "brands": brands,
-        "channels": channels,
-        "primary_intent": intent,
-        "all_intents": [intent] if intent else [],
-        "models": [],
-    }
-    for i, (sub, rtype, text, sent, brands, channels, intent) in enumerate([
-        ("Sneakers", "post", "Love my Nike Air Max", 0.8, ["Nike"], ["StockX"],
-         "completed_purchase"),
-        ("Sneakers", "post", "Adidas Samba is fire", 0.6, ["Adidas"], ["GOAT"],
-         "seeking_purchase"),
-        ("Nike", "post", "Nike Dunk Low review", 0.5, ["Nike"], [], None),
-        ("Nike", "comment", "These Dunks are great", 0.7, ["Nike"], ["Foot Locker"],
-         "completed_purchase"),
-        ("Adidas", "post", "Yeezy 350 hype is real", 0.3, ["Adidas"], ["eBay"], "marketplace"),
-        ("Adidas", "comment", "Adidas quality dropped", -0.4, ["Adidas"], [], None),
-        ("Jordans", "post", "Air Jordan 1 Chicago colorway", 0.9, ["Nike"], [], None),
-        ("Jordans", "comment", "Jordan 1s never go out of style", 0.8, ["Nike"], ["GOAT"],
-         "purchase_consideration"),
-        ("Sneakers", "post", "New Balance 990 comfort test", 0.5, ["New Balance"], [], None),
-        ("Sneakers", "comment", "NB990 fit wide feet", 0.6, ["New Balance"], [],
-         "seeking_purchase"),
-    ])
+    ("Sneakers", "post", "Love my Nike Air Max", 0.8, ["Nike"], ["StockX"],
+     "completed_purchase"),
+    ("Sneakers", "post", "Adidas Samba is fire", 0.6, ["Adidas"], ["GOAT"],
+     "seeking_purchase"),
+    ("Nike", "post", "Nike Dunk Low review", 0.5, ["Nike"], [], None),
+    ("Nike", "comment", "These Dunks are great", 0.7, ["Nike"], ["Foot Locker"],
+     "completed_purchase"),
+    ("Adidas", "post", "Yeezy 350 hype is real", 0.3, ["Adidas"], ["eBay"], "marketplace"),
+    ("Adidas", "comment", "Adidas quality dropped", -0.4, ["Adidas"], [], None),
+    ("Jordans", "post", "Air Jordan 1 Chicago colorway", 0.9, ["Nike"], [], None),
+    ("Jordans", "comment", "Jordan 1s never go out of style", 0.8, ["Nike"], ["GOAT"],
+     "purchase_consideration"),
+    ("Sneakers", "post", "New Balance 990 comfort test", 0.5, ["New Balance"], [], None),
+    ("Sneakers", "comment", "NB990 fit wide feet", 0.6, ["New Balance"], [],
+     "seeking_purchase"),
 ]
 
-_SAMPLE_DF = pd.DataFrame(SAMPLE_ROWS)
 
-
-@pytest.fixture(autouse=True)
-def patch_load_df():
-    """Patch _load_df so all endpoints use the sample DataFrame."""
-    with patch("reddit_sentiment.api.app._load_df", return_value=_SAMPLE_DF):
+@pytest.fixture(scope="session")
+def sample_df() -> pd.DataFrame:
+    """The sample frame, built on first use (only if an API test is selected)."""
+    # Built column by column, so pandas infers each dtype once instead of per row dict
+    subs, rtypes, texts, sents, brands, channels, intents = map(list, zip(*SAMPLE_ROWS))
+    n = len(SAMPLE_ROWS)
+    return pd.DataFrame(
+        {
+            "id": [f"t3_{i}" for i in range(n)],
+            "subreddit": subs,
+            "record_type": rtypes,
+            "score": np.full(n, 100, dtype=np.int64),
+            "created_utc": pd.date_range("2026-01-15", periods=n, freq="D", tz="UTC"),
+            "full_text": texts,
+            "vader_score": np.asarray(sents, dtype=np.float64),
+            "hybrid_score": np.asarray(sents, dtype=np.float64),
+            "transformer_score": [None] * n,
+            "brands": brands,
+            "channels": channels,
+            "primary_intent": intents,
+            "all_intents": [[intent] if intent else [] for intent in intents],
+            "models": [[] for _ in range(n)],
+        }
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_load_df(sample_df):
+    """Patch _load_df once for the module so all endpoints use the sample DataFrame."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("reddit_sentiment.api.app._load_df", lambda: sample_df)
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    return TestClient(app)
+    # Context-manager form: the app's lifespan starts and stops once for the module
+    with TestClient(app) as c:
+        yield c
 
 
 # ---------------------------------------------------------------------------
@@ -70,12 +80,12 @@ def client():
 # ---------------------------------------------------------------------------
 
 
-def test_health_status(client):
+def test_health_status(client, sample_df):
     resp = client.get("/health")
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "ok"
-    assert data["records"] == len(_SAMPLE_DF)
+    assert data["records"] == len(sample_df)
 
 
 def test_health_data_path(client):
@@ -199,31 +209,31 @@ def test_trends_point_fields(client):
 # ---------------------------------------------------------------------------
 
 
-def test_analyze_detects_nike(client):
-    resp = client.post("/analyze", json={"text": "Just copped the Nike Air Force 1 low"})
+@pytest.mark.parametrize(
+    ("text", "field", "expected"),
+    [
+        ("Just copped the Nike Air Force 1 low", "brands", "Nike"),
+        ("My AJ1 Chicago is pristine", "models", "Air Jordan 1"),
+    ],
+    ids=["brand", "shoe_model"],
+)
+def test_analyze_detects(client, text, field, expected):
+    resp = client.post("/analyze", json={"text": text})
     assert resp.status_code == 200
-    data = resp.json()
-    assert "Nike" in data["brands"]
-
-
-def test_analyze_positive_sentiment(client):
-    resp = client.post("/analyze", json={"text": "Absolutely love these sneakers, perfect fit!"})
-    data = resp.json()
-    assert data["sentiment_label"] == "Positive"
-    assert data["vader_score"] > 0
-
-
-def test_analyze_negative_sentiment(client):
-    resp = client.post("/analyze", json={"text": "Terrible quality, fell apart after one wear."})
-    data = resp.json()
-    assert data["sentiment_label"] == "Negative"
-    assert data["vader_score"] < 0
-
-
-def test_analyze_detects_shoe_model(client):
-    resp = client.post("/analyze", json={"text": "My AJ1 Chicago is pristine"})
-    data = resp.json()
-    assert "Air Jordan 1" in data["models"]
+    assert expected in resp.json()[field]
+
+
+@pytest.mark.parametrize(
+    ("compound", "label"),
+    [(0.8, "Positive"), (-0.8, "Negative"), (0.0, "Neutral")],
+    ids=["positive", "negative", "neutral"],
+)
+def test_analyze_sentiment(client, compound, label):
+    # Stub the scorer: these tests cover the labelling contract, not VADER itself
+    with patch("reddit_sentiment.api.app._vader.score", return_value=compound):
+        data = client.post("/analyze", json={"text": "these sneakers"}).json()
+    assert data["sentiment_label"] == label
+    assert data["vader_score"] == compound
 
 
 def test_analyze_empty_text_returns_422(client):
@@ -0,0 +1,24 @@
+"""Fixtures shared by the collection tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def written(monkeypatch) -> dict[str, pd.DataFrame]:
+    """Capture the frame ``collect`` writes instead of encoding it to Parquet.
+
+    The output path is still touched so the returned path exists.
+    """
+    captured: dict[str, pd.DataFrame] = {}
+
+    def fake_to_parquet(self, path, **kwargs):
+        captured["df"] = self
+        Path(path).touch()
+
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", fake_to_parquet)
+    return captured
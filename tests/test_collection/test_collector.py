@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import json
+import re
 from datetime import UTC, datetime
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-import pandas as pd
+import praw
+import pytest
 
+from reddit_sentiment.collection import collector as collector_module
 from reddit_sentiment.collection.collector import SubredditCollector, _extract_urls
 
 # ---------------------------------------------------------------------------
@@ -16,43 +20,59 @@ from reddit_sentiment.collection.collector import SubredditCollector, _extract_u
 # ---------------------------------------------------------------------------
 
 
-def _make_submission(sid: str = "s1", title: str = "Test Post", body: str = "", score: int = 10):
-    sub = MagicMock()
-    sub.id = sid
-    sub.title = title
-    sub.selftext = body
-    sub.author = MagicMock()
-    sub.author.__str__ = lambda self: "testuser"
-    sub.score = score
-    sub.upvote_ratio = 0.9
-    sub.num_comments = 5
-    sub.created_utc = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
-    sub.url = f"https://reddit.com/{sid}"
-    sub.permalink = f"/r/Sneakers/{sid}"
-    sub.is_self = True
-    sub.link_flair_text = None
-    # comments mock
-    comments_mock = MagicMock()
-    comments_mock.replace_more.return_value = None
-    comments_mock.list.return_value = []
-    sub.comments = comments_mock
-    return sub
+class _CommentForest:
+    """Stand-in for ``submission.comments``: ``replace_more`` is a no-op."""
+
+    def __init__(self, comments: list) -> None:
+        self._comments = comments
+
+    def replace_more(self, limit: int | None = None) -> None:
+        return None
+
+    def list(self) -> list:
+        return self._comments
+
+
+def _make_submission(
+    sid: str = "s1",
+    title: str = "Test Post",
+    body: str = "",
+    score: int = 10,
+    comments: list | None = None,
+):
+    return SimpleNamespace(
+        id=sid,
+        title=title,
+        selftext=body,
+        author="testuser",
+        score=score,
+        upvote_ratio=0.9,
+        num_comments=5,
+        created_utc=datetime(2024, 1, 1, tzinfo=UTC).timestamp(),
+        url=f"https://reddit.com/{sid}",
+        permalink=f"/r/Sneakers/{sid}",
+        is_self=True,
+        link_flair_text=None,
+        comments=_CommentForest(comments or []),
+    )
 
 
 def _make_comment(cid: str = "c1", body: str = "Nice!"):
-    import praw
-
-    cmt = MagicMock(spec=praw.models.Comment)
-    cmt.id = cid
-    cmt.body = body
-    cmt.author = MagicMock()
-    cmt.author.__str__ = lambda self: "commenter"
-    cmt.score = 2
-    cmt.created_utc = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
-    cmt.permalink = f"/r/Sneakers/{cid}"
-    cmt.parent_id = "t3_s1"
-    cmt.depth = 0
-    return cmt
+    # A real Comment built from data (no API access), so the collector's
+    # isinstance check passes without a spec'd MagicMock
+    return praw.models.Comment(
+        None,
+        _data={
+            "id": cid,
+            "body": body,
+            "author": "commenter",
+            "score": 2,
+            "created_utc": datetime(2024, 1, 1, tzinfo=UTC).timestamp(),
+            "permalink": f"/r/Sneakers/{cid}",
+            "parent_id": "t3_s1",
+            "depth": 0,
+        },
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +92,14 @@ def test_extract_urls_empty():
     assert _extract_urls("no urls here!") == []
 
 
+def test_extract_urls_uses_module_pattern():
+    # Compiled once at import; a per-call re.compile would bypass the module attribute
+    assert isinstance(collector_module._URL_RE, re.Pattern)
+    with patch.object(collector_module, "_URL_RE") as url_re:
+        _extract_urls("https://goat.com")
+    url_re.findall.assert_called_once_with("https://goat.com")
+
+
 # ---------------------------------------------------------------------------
 # SubredditCollector
 # ---------------------------------------------------------------------------
@@ -96,55 +124,52 @@ def _build_collector(tmp_path: Path) -> SubredditCollector:
     return collector
 
 
-@patch("reddit_sentiment.collection.collector.RedditClient")
-def test_collect_creates_parquet(MockClient, tmp_path):
-    collector = _build_collector(tmp_path)
+@pytest.fixture
+def collector(tmp_path):
+    """Collector over a temp dir, with RedditClient patched out for the test."""
+    with patch("reddit_sentiment.collection.collector.RedditClient"):
+        collector = _build_collector(tmp_path)
+        collector._client = MagicMock()
+        yield collector
 
-    # Patch the PRAW subreddit call
-    sub_mock = MagicMock()
-    sub_mock.hot.return_value = [_make_submission("s1"), _make_submission("s2")]
-    collector._client = MagicMock()
-    collector._client.subreddit.return_value = sub_mock
 
-    out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
-    assert out.exists()
-    df = pd.read_parquet(out)
-    assert len(df) == 2
-    assert "full_text" in df.columns
-    assert "record_type" in df.columns
+def _serve(collector: SubredditCollector, *submissions) -> None:
+    """Have r/Sneakers' hot listing return *submissions*."""
+    collector._client.subreddit.return_value.hot.return_value = list(submissions)
+
 
+def _setup_posts(collector):
+    _serve(collector, _make_submission("s1"), _make_submission("s2"))
 
-@patch("reddit_sentiment.collection.collector.RedditClient")
-def test_collect_skips_checkpointed(MockClient, tmp_path):
-    collector = _build_collector(tmp_path)
 
+def _setup_checkpointed(collector):
     # Pre-write checkpoint saying Sneakers is done
     collector._checkpoint_path.write_text(json.dumps({"Sneakers": True}))
 
-    collector._client = MagicMock()
-    out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
-    df = pd.read_parquet(out)
-    # Should be empty because subreddit was skipped
-    assert len(df) == 0
-    # Client subreddit should NOT have been called
-    collector._client.subreddit.assert_not_called()
 
+def _setup_comments(collector):
+    _serve(collector, _make_submission("s1", comments=[_make_comment("c1", "Great shoe!")]))
 
-@patch("reddit_sentiment.collection.collector.RedditClient")
-def test_collect_includes_comments(MockClient, tmp_path):
-    collector = _build_collector(tmp_path)
 
-    comment = _make_comment("c1", "Great shoe!")
-    submission = _make_submission("s1")
-    submission.comments.list.return_value = [comment]
-
-    sub_mock = MagicMock()
-    sub_mock.hot.return_value = [submission]
-    collector._client = MagicMock()
-    collector._client.subreddit.return_value = sub_mock
+@pytest.mark.parametrize(
+    ("setup", "expected_rows", "expected_types"),
+    [
+        pytest.param(_setup_posts, 2, {"post"}, id="creates_parquet"),
+        # Empty because the subreddit was skipped
+        pytest.param(_setup_checkpointed, 0, set(), id="skips_checkpointed"),
+        pytest.param(_setup_comments, 2, {"post", "comment"}, id="includes_comments"),
+    ],
+)
+def test_collect(collector, written, tmp_path, setup, expected_rows, expected_types):
+    setup(collector)
 
     out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
-    df = pd.read_parquet(out)
-    assert len(df) == 2  # 1 post + 1 comment
-    types = set(df["record_type"].tolist())
-    assert types == {"post", "comment"}
+    assert out.exists()
+    df = written["df"]
+    assert len(df) == expected_rows
+    if expected_rows:
+        assert {"full_text", "record_type"} <= set(df.columns)
+        assert set(df["record_type"].tolist()) == expected_types
+    else:
+        # Client subreddit should NOT have been called
+        collector._client.subreddit.assert_not_called()
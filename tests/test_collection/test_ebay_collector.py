@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from reddit_sentiment.collection.ebay_collector import EbayCollector
@@ -23,6 +24,11 @@ def _configured_collector() -> EbayCollector:
     return EbayCollector(config=EbayConfig(EBAY_APP_ID="dummy-key-for-tests"))
 
 
+def _write_listings(path, rows: list[dict]) -> None:
+    """Write *rows* as a parquet file straight from Arrow (no pandas frame or index)."""
+    pq.write_table(pa.Table.from_pylist(rows), path)
+
+
 # ---------------------------------------------------------------------------
 # Configuration guard
 # ---------------------------------------------------------------------------
@@ -59,11 +65,8 @@ def test_load_latest_returns_most_recent(tmp_path):
     older = tmp_path / "ebay_20240101_000000.parquet"
     newer = tmp_path / "ebay_20240202_120000.parquet"
 
-    df_old = pd.DataFrame([{"model": "old", "sold_price_usd": 100.0}])
-    df_new = pd.DataFrame([{"model": "new", "sold_price_usd": 200.0}])
-
-    df_old.to_parquet(older, index=False)
-    df_new.to_parquet(newer, index=False)
+    _write_listings(older, [{"model": "old", "sold_price_usd": 100.0}])
+    _write_listings(newer, [{"model": "new", "sold_price_usd": 200.0}])
 
     result = EbayCollector.load_latest(tmp_path)
     assert result["model"].iloc[0] == "new"
@@ -72,8 +75,7 @@ def test_load_latest_returns_most_recent(tmp_path):
 def test_load_latest_ignores_non_ebay_parquets(tmp_path):
     """Files not matching ebay_*.parquet should be ignored."""
     other = tmp_path / "annotated.parquet"
-    other_df = pd.DataFrame([{"model": "annotated", "sold_price_usd": 99.0}])
-    other_df.to_parquet(other, index=False)
+    _write_listings(other, [{"model": "annotated", "sold_price_usd": 99.0}])
 
     with pytest.raises(FileNotFoundError):
         EbayCollector.load_latest(tmp_path)
@@ -81,10 +83,9 @@ def test_load_latest_ignores_non_ebay_parquets(tmp_path):
 
 def test_load_latest_single_file(tmp_path):
     ebay_file = tmp_path / "ebay_20250101_000000.parquet"
-    df = pd.DataFrame([
+    _write_listings(ebay_file, [
         {"model": "Dunk Low", "sold_price_usd": 250.0, "condition": "New"},
     ])
-    df.to_parquet(ebay_file, index=False)
 
     result = EbayCollector.load_latest(tmp_path)
     assert len(result) == 1
@@ -118,9 +119,8 @@ def test_collect_saves_parquet(tmp_path, monkeypatch):
 
     assert result_path == out_path
     assert out_path.exists()
-    df = pd.read_parquet(out_path)
-    assert len(df) == 1
-    assert df["sold_price_usd"].iloc[0] == 180.0
+    prices = pq.read_table(out_path, columns=["sold_price_usd"]).column(0)
+    assert prices.to_pylist() == [180.0]
 
 
 def test_collect_empty_when_no_results(tmp_path, monkeypatch):
@@ -130,5 +130,4 @@ def test_collect_empty_when_no_results(tmp_path, monkeypatch):
     out_path = tmp_path / "ebay_empty.parquet"
     collector.collect(["NonExistentModel"], output_path=out_path)
 
-    df = pd.read_parquet(out_path)
-    assert df.empty
+    assert pq.read_metadata(out_path).num_rows == 0
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
+import orjson
 import pandas as pd
+import pytest
+import requests
 
 from reddit_sentiment.collection.public_collector import (
     PublicSubredditCollector,
@@ -29,33 +33,98 @@ def _cfg(tmp_path, subreddits=("Sneakers",), posts_per=6):
     )
 
 
-def _make_collector(tmp_path, **kwargs) -> PublicSubredditCollector:
-    return PublicSubredditCollector(config=_cfg(tmp_path, **kwargs))
+@pytest.fixture(autouse=True, scope="module")
+def _no_sleep():
+    """Skip the collector's request delays for every test in the module."""
+    with patch("reddit_sentiment.collection.public_collector.time.sleep"):
+        yield
 
 
-def _post_data(pid="abc123", score=100, num_comments=10, subreddit="Sneakers"):
-    return {
-        "id": pid,
+@pytest.fixture(scope="module")
+def shared_collector(tmp_path_factory) -> PublicSubredditCollector:
+    return PublicSubredditCollector(config=_cfg(tmp_path_factory.mktemp("public")))
+
+
+@pytest.fixture
+def collector(shared_collector, monkeypatch) -> PublicSubredditCollector:
+    """The module's collector with a fresh session and default subreddits."""
+    monkeypatch.setattr(shared_collector, "_session", requests.Session())
+    monkeypatch.setattr(shared_collector._cfg, "subreddits", ["Sneakers"])
+    return shared_collector
+
+
+# Fields shared by every fake post; _post_data() fills in the per-post ones
+_BASE_POST = MappingProxyType(
+    {
         "title": "Test post about Nike Air Jordan 1",
         "selftext": "Great shoe, love it",
         "author": "testuser",
-        "score": score,
         "upvote_ratio": 0.95,
-        "num_comments": num_comments,
         "created_utc": datetime(2025, 1, 1, tzinfo=UTC).timestamp(),
-        "url": f"https://reddit.com/{pid}",
-        "permalink": f"/r/{subreddit}/{pid}",
         "is_self": True,
         "link_flair_text": None,
+    }
+)
+
+
+def _post_data(pid="abc123", score=100, num_comments=10, subreddit="Sneakers"):
+    return {
+        **_BASE_POST,
+        "id": pid,
+        "score": score,
+        "num_comments": num_comments,
+        "url": f"https://reddit.com/{pid}",
+        "permalink": f"/r/{subreddit}/{pid}",
         "subreddit": subreddit,
     }
 
 
+class _StubAdapter(requests.adapters.BaseAdapter):
+    """Transport that answers every request with the next queued payload.
+
+    The last payload is repeated once the queue runs out; an exception payload
+    is raised instead of returned.
+    """
+
+    def __init__(self, payloads) -> None:
+        super().__init__()
+        self._payloads = list(payloads)
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs) -> requests.Response:
+        self.requests.append(request)
+        payload = self._payloads.pop(0) if len(self._payloads) > 1 else self._payloads[0]
+        if isinstance(payload, Exception):
+            raise payload
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = request.url
+        resp.request = request
+        resp._content = orjson.dumps(payload)
+        return resp
+
+    def close(self) -> None:
+        pass
+
+
+def _serve(collector: PublicSubredditCollector, *payloads) -> _StubAdapter:
+    """Mount a stub transport answering the collector's requests with *payloads*."""
+    adapter = _StubAdapter(payloads)
+    collector._session.mount("https://", adapter)
+    return adapter
+
+
 def _pullpush_response(posts: list[dict], has_more: bool = False) -> dict:
     """Wrap raw post dicts in PullPush API response structure."""
     return {"data": posts}
 
 
+# Parsing never mutates a payload, so the common ones are built once
+_POST = _post_data()
+_TWO_POSTS_JSON = _pullpush_response([_post_data("p1"), _post_data("p2")])
+_ONE_POST_JSON = _pullpush_response([_post_data("p1")])
+
+
 # ---------------------------------------------------------------------------
 # _extract_urls
 # ---------------------------------------------------------------------------
@@ -79,15 +148,13 @@ def test_extract_urls_empty():
 
 
 def test_parse_pullpush_post_full_text():
-    data = _post_data()
-    post = _parse_pullpush_post(data)
+    post = _parse_pullpush_post(_POST)
     assert "Nike Air Jordan 1" in post.full_text
     assert "Great shoe" in post.full_text
 
 
 def test_parse_pullpush_post_record_type():
-    data = _post_data()
-    post = _parse_pullpush_post(data)
+    post = _parse_pullpush_post(_POST)
     assert post.to_dict()["record_type"] == "post"
 
 
@@ -104,39 +171,27 @@ def test_parse_pullpush_post_fields():
 # ---------------------------------------------------------------------------
 
 
-def test_fetch_subreddit_returns_records(tmp_path):
-    collector = _make_collector(tmp_path)
-    posts = [_post_data("p1"), _post_data("p2")]
-    fake_resp = MagicMock()
-    fake_resp.raise_for_status.return_value = None
-    fake_resp.json.return_value = _pullpush_response(posts)
-    collector._session = MagicMock()
-    collector._session.get.return_value = fake_resp
+def test_fetch_subreddit_returns_records(collector):
+    adapter = _serve(collector, _TWO_POSTS_JSON)
 
-    with patch("reddit_sentiment.collection.public_collector.time.sleep"):
-        records = collector._fetch_subreddit("Sneakers", limit=10)
+    records = collector._fetch_subreddit("Sneakers", limit=10)
 
     assert len(records) == 2
     assert all(r["record_type"] == "post" for r in records)
+    # One page: fewer items than the batch size ends pagination
+    assert len(adapter.requests) == 1
+    assert "subreddit=Sneakers" in adapter.requests[0].url
 
 
-def test_fetch_subreddit_handles_request_error(tmp_path):
-    import requests as req
-    collector = _make_collector(tmp_path)
-    collector._session = MagicMock()
-    collector._session.get.side_effect = req.RequestException("timeout")
+def test_fetch_subreddit_handles_request_error(collector):
+    _serve(collector, requests.ConnectionError("timeout"))
 
     records = collector._fetch_subreddit("Sneakers", limit=10)
     assert records == []
 
 
-def test_fetch_subreddit_empty_response(tmp_path):
-    collector = _make_collector(tmp_path)
-    fake_resp = MagicMock()
-    fake_resp.raise_for_status.return_value = None
-    fake_resp.json.return_value = {"data": []}
-    collector._session = MagicMock()
-    collector._session.get.return_value = fake_resp
+def test_fetch_subreddit_empty_response(collector):
+    _serve(collector, {"data": []})
 
     records = collector._fetch_subreddit("Sneakers", limit=10)
     assert records == []
@@ -147,37 +202,25 @@ def test_fetch_subreddit_empty_response(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_collect_saves_parquet(tmp_path):
-    collector = _make_collector(tmp_path)
-    posts = [_post_data("p1"), _post_data("p2")]
-    fake_resp = MagicMock()
-    fake_resp.raise_for_status.return_value = None
-    fake_resp.json.return_value = _pullpush_response(posts)
-    collector._session = MagicMock()
-    collector._session.get.return_value = fake_resp
+def test_collect_saves_parquet(collector, written):
+    _serve(collector, _TWO_POSTS_JSON)
 
-    with patch("reddit_sentiment.collection.public_collector.time.sleep"):
-        out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
+    out = collector.collect(output_path=collector._cfg.raw_data_dir / "single.parquet")
 
     assert out.exists()
-    df = pd.read_parquet(out)
+    df = written["df"]
     assert len(df) == 2
     assert "record_type" in df.columns
 
 
-def test_collect_multi_subreddit(tmp_path):
-    collector = _make_collector(tmp_path, subreddits=("Sneakers", "Nike"))
-    fake_resp = MagicMock()
-    fake_resp.raise_for_status.return_value = None
-    fake_resp.json.return_value = _pullpush_response([_post_data("p1")])
-    collector._session = MagicMock()
-    collector._session.get.return_value = fake_resp
+def test_collect_multi_subreddit(collector, written):
+    collector._cfg.subreddits = ["Sneakers", "Nike"]
+    _serve(collector, _ONE_POST_JSON)
 
-    with patch("reddit_sentiment.collection.public_collector.time.sleep"):
-        out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
+    out = collector.collect(output_path=collector._cfg.raw_data_dir / "multi.parquet")
 
-    df = pd.read_parquet(out)
-    assert len(df) == 2  # 1 post per subreddit
+    assert out.exists()
+    assert len(written["df"]) == 2  # 1 post per subreddit
 
 
 def test_load_latest(tmp_path):
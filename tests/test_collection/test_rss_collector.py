@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 from reddit_sentiment.collection.rss_collector import (
     RSSSubredditCollector,
@@ -221,9 +222,8 @@ def test_collect_saves_parquet(tmp_path):
         out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
 
     assert out.exists()
-    df = pd.read_parquet(out)
-    assert len(df) == 2
-    assert "record_type" in df.columns
+    assert pq.read_metadata(out).num_rows == 2
+    assert "record_type" in pq.read_schema(out).names
 
 
 def test_collect_multi_subreddit(tmp_path):
@@ -238,8 +238,7 @@ def test_collect_multi_subreddit(tmp_path):
     with patch("reddit_sentiment.collection.rss_collector.time.sleep"):
         out = collector.collect(output_path=tmp_path / "raw" / "test.parquet")
 
-    df = pd.read_parquet(out)
-    assert len(df) == 2  # 1 post per subreddit
+    assert pq.read_metadata(out).num_rows == 2  # 1 post per subreddit
 
 
 def test_load_latest(tmp_path):
@@ -4,8 +4,24 @@ import pytest
 
 from reddit_sentiment.detection.brands import BRAND_ALIASES, BrandDetector
 
+# Canonical brand names every alias must resolve to
+_EXPECTED_BRANDS = frozenset(
+    {
+        "Nike",
+        "Adidas",
+        "Li-Ning",
+        "Anta",
+        "361 Degrees",
+        "Under Armour",
+        "New Balance",
+        "Puma",
+        "Asics",
+        "Hoka",
+    }
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def detector():
     return BrandDetector(context_window=5)
 
@@ -69,16 +85,65 @@ def test_empty_text(detector):
 
 
 def test_all_canonical_brands_present():
-    expected = {
-        "Nike",
-        "Adidas",
-        "Li-Ning",
-        "Anta",
-        "361 Degrees",
-        "Under Armour",
-        "New Balance",
-        "Puma",
-        "Asics",
-        "Hoka",
-    }
-    assert expected == set(BRAND_ALIASES.keys())
+    assert BRAND_ALIASES.keys() == _EXPECTED_BRANDS
+
+
+def test_detect_raw_matches_detect(detector):
+    text = "Comparing Nike Air Max with New Balance 990"
+    starts, ends, brand_idx = detector.detect_raw(text)
+    mentions = detector.detect(text)
+    assert starts.tolist() == [m.start for m in mentions]
+    assert ends.tolist() == [m.end for m in mentions]
+    assert [detector.brands[i] for i in brand_idx] == [m.brand for m in mentions]
+
+
+def test_detect_raw_empty_text(detector):
+    starts, ends, brand_idx = detector.detect_raw("")
+    assert starts.size == ends.size == brand_idx.size == 0
+
+
+def test_detect_brands_in_order_of_occurrence(detector):
+    assert detector.detect_brands("Hoka or Nike, then Hoka again") == ["Hoka", "Nike"]
+
+
+def test_detect_without_context(detector):
+    text = "I just bought Nike Air Max and they are amazing"
+    with_ctx = detector.detect(text)
+    without_ctx = detector.detect(text, context=False)
+    assert [(m.brand, m.start, m.end) for m in without_ctx] == [
+        (m.brand, m.start, m.end) for m in with_ctx
+    ]
+    assert all(m.context == "" and not m.context_words_before for m in without_ctx)
+
+
+def test_overlapping_aliases_of_one_brand_each_give_a_mention(detector):
+    # One mention per matched alias span; the transformer scores each context
+    mentions = detector.detect("Adidas Originals drop")
+    assert [(m.alias, m.start, m.end) for m in mentions] == [
+        ("Adidas", 0, 6),
+        ("Adidas Originals", 0, 16),
+    ]
+    jordan = [(m.alias, m.start) for m in detector.detect("New Air Jordan 1s")]
+    assert jordan == [("Air Jordan", 4), ("Jordan", 8)]
+
+
+def test_overlapping_aliases_of_different_brands_both_detected(detector):
+    brands = detector.detect_brands("ANTA Sports Li-Ning merger")
+    assert "Anta" in brands
+    assert "Li-Ning" in brands
+
+
+def test_detectors_share_compiled_patterns(detector):
+    other = BrandDetector(context_window=2)
+    assert other._patterns is detector._patterns
+    assert other.detect_brands("Nike and Hoka") == detector.detect_brands("Nike and Hoka")
+
+
+def test_brand_mention_uses_slots(detector):
+    mention = detector.detect("I love Nike shoes")[0]
+    assert not hasattr(mention, "__dict__")
+
+
+@pytest.mark.parametrize("text", ["NIKE drop", "nİke drop", "aſics gel", "NB 990 restock"])
+def test_prefilter_does_not_drop_case_insensitive_matches(detector, text):
+    assert detector.detect_brands(text)
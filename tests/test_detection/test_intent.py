@@ -2,10 +2,10 @@
 
 import pytest
 
-from reddit_sentiment.detection.intent import PurchaseIntentClassifier
+from reddit_sentiment.detection.intent import PurchaseIntentClassifier, _first_chars, _literal
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def clf():
     return PurchaseIntentClassifier()
 
@@ -66,3 +66,50 @@ def test_priority_completed_over_marketplace(clf):
     text = "Just copped a pair. Also have one for sale."
     result = clf.classify(text)
     assert result.primary_intent == "completed_purchase"
+
+
+def test_overlapping_phrases_all_reported(clf):
+    # "just copped" is listed twice and also contains "copped"
+    result = clf.classify("Just copped these, copped another")
+    assert result.matched_patterns["completed_purchase"] == [
+        "Just copped",
+        "copped",
+        "copped",
+        "Just copped",
+    ]
+
+
+def test_phrase_shared_by_two_intents(clf):
+    result = clf.classify("Pair for sale, DM me")
+    assert result.matched_patterns["marketplace"] == ["for sale"]
+    assert result.matched_patterns["selling"] == ["for sale"]
+
+
+def test_first_chars_of_pattern_openings():
+    assert _first_chars(r"\bWTS\b") == "w"
+    assert _first_chars(r"\b(price|cost|value)\b.{0,10}\bfair\b") == "cpv"
+    assert _first_chars(r"\$[\d,]+") == ""
+
+
+def test_literal_is_longest_required_word():
+    assert _literal(r"\bjust\s+copped\b") == "copped"
+    assert _literal(r"\brestocked?\b") == "restocke"
+    assert _literal(r"\bWTS\b") == "wts"
+    assert _literal(r"\bpaid\s+\$[\d,]+") == "paid"
+    assert _literal(r"\b(price|cost|value)\b.{0,10}\b(fair|high)\b") is None
+
+
+@pytest.mark.parametrize("text", ["JUST COPPED these", "\u017felling my pair", "In \u017ftock now"])
+def test_prefilter_keeps_case_insensitive_matches(clf, text):
+    assert clf.classify(text).all_intents
+
+
+def test_classify_batch_matches_classify(clf):
+    texts = [
+        "Just copped these, pulled a pair on SNKRS",
+        "",
+        "WTS size 10, market price thoughts?",
+        "nothing to see here",
+        "Pair for sale, DM for price",
+    ]
+    assert clf.classify_batch(texts) == [clf.classify(t) for t in texts]
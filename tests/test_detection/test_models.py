@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import pandas as pd
 import pytest
 
 from reddit_sentiment.detection.models import MODEL_CATALOG, MODEL_INFO, ModelDetector
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def detector():
     return ModelDetector()
 
@@ -17,11 +18,11 @@ def detector():
 # ---------------------------------------------------------------------------
 
 
-def test_aj1_aliases_resolve_to_canonical(detector):
+@pytest.mark.parametrize("alias", ["AJ1", "Jordan 1", "J1", "OG 1s"])
+def test_aj1_aliases_resolve_to_canonical(detector, alias):
     """Multiple AJ1 aliases should all resolve to 'Air Jordan 1'."""
-    for alias in ["AJ1", "Jordan 1", "J1", "OG 1s"]:
-        models = detector.detect_models(f"Just copped the {alias} in Chicago colourway")
-        assert "Air Jordan 1" in models, f"Alias '{alias}' not mapped to Air Jordan 1"
+    models = detector.detect_models(f"Just copped the {alias} in Chicago colourway")
+    assert "Air Jordan 1" in models
 
 
 def test_dunk_low_alias(detector):
@@ -29,16 +30,16 @@ def test_dunk_low_alias(detector):
     assert "Dunk Low" in models
 
 
-def test_af1_aliases(detector):
-    for alias in ["AF1", "Air Force 1", "Air Force One", "Forces"]:
-        models = detector.detect_models(f"wearing my {alias} today")
-        assert "Air Force 1" in models, f"Alias '{alias}' not mapped to Air Force 1"
+@pytest.mark.parametrize("alias", ["AF1", "Air Force 1", "Air Force One", "Forces"])
+def test_af1_aliases(detector, alias):
+    models = detector.detect_models(f"wearing my {alias} today")
+    assert "Air Force 1" in models
 
 
-def test_yeezy_350_aliases(detector):
-    for alias in ["Yeezy 350", "350 v2", "350v2", "Yeezy Boost 350"]:
-        models = detector.detect_models(f"picked up the {alias}")
-        assert "Yeezy 350" in models
+@pytest.mark.parametrize("alias", ["Yeezy 350", "350 v2", "350v2", "Yeezy Boost 350"])
+def test_yeezy_350_aliases(detector, alias):
+    models = detector.detect_models(f"picked up the {alias}")
+    assert "Yeezy 350" in models
 
 
 def test_samba_alias(detector):
@@ -75,6 +76,33 @@ def test_overlapping_span_not_double_counted(detector):
                 assert not (s1 < e2 and s2 < e1), f"Overlapping spans: {spans[i]} vs {spans[j]}"
 
 
+def test_mention_spans_strictly_increasing(detector):
+    """Mention-heavy text still yields ordered, non-overlapping spans."""
+    text = " / ".join(["Air Jordan 1", "AJ1", "Jordan 11", "Air Max 90", "AM 90"] * 20)
+    mentions = detector.detect(text)
+    assert len(mentions) == 100
+    assert all(a.end <= b.start for a, b in zip(mentions, mentions[1:]))
+
+
+def test_detectors_share_compiled_tables(detector):
+    other = ModelDetector()
+    assert other._pattern is detector._pattern
+    assert other._aliases is detector._aliases
+
+
+def test_model_mention_uses_slots(detector):
+    mention = detector.detect("Air Jordan 1 review")[0]
+    assert not hasattr(mention, "__dict__")
+
+
+def test_longest_alias_wins_at_a_position(detector):
+    mentions = detector.detect("SB Dunk Low and New Balance 990 restock")
+    assert [(m.model, m.alias) for m in mentions] == [
+        ("Dunk Low", "SB Dunk Low"),
+        ("NB 990", "New Balance 990"),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Multiple models in one text
 # ---------------------------------------------------------------------------
@@ -92,6 +120,30 @@ def test_empty_text_returns_empty(detector):
     assert detector.detect("") == []
 
 
+# ---------------------------------------------------------------------------
+# Batch detection
+# ---------------------------------------------------------------------------
+
+
+def test_detect_batch_matches_detect(detector):
+    texts = pd.Series(
+        ["SB Dunk Low and aj1", "nothing here", None, "AM 90 / Air Max 90 / am90"],
+        index=[10, 11, 12, 13],
+    )
+    batch = detector.detect_batch(texts)
+    for idx, text in texts.items():
+        mentions = detector.detect(text) if isinstance(text, str) else []
+        expected = [(m.model, m.alias) for m in mentions]
+        got = batch.loc[idx] if idx in batch.index.get_level_values(0) else batch.iloc[:0]
+        assert list(zip(got["model"], got["alias"])) == expected
+
+
+def test_detect_batch_empty_series(detector):
+    batch = detector.detect_batch(pd.Series([], dtype=object))
+    assert batch.empty
+    assert list(batch.columns) == ["model", "brand", "alias", "retail_price"]
+
+
 # ---------------------------------------------------------------------------
 # MODEL_CATALOG / MODEL_INFO structure
 # ---------------------------------------------------------------------------
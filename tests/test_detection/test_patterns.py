@@ -0,0 +1,26 @@
+"""Tests for the shared detector regex builders."""
+
+import re
+
+from reddit_sentiment.detection.patterns import fold, trie_regex
+
+
+def test_trie_regex_shares_prefixes():
+    assert trie_regex(["foot locker", "footlocker"]) == r"foot(?:\ locker|locker)"
+
+
+def test_trie_regex_prefers_longest_word():
+    pattern = re.compile(trie_regex(["end", "end clothing"]))
+    assert pattern.match("end clothing").group(0) == "end clothing"
+    assert pattern.match("end game").group(0) == "end"
+
+
+def test_trie_regex_backtracks_to_shorter_word_at_boundary():
+    pattern = re.compile(r"\b" + trie_regex(["dunk", "dunk low"]) + r"\b", re.IGNORECASE)
+    assert pattern.search("Dunk lo-fi").group(0) == "Dunk"
+
+
+def test_fold_matches_ignorecase_letters():
+    assert fold("NIKE") == "nike"
+    assert fold("n\u0130ke") == "nike"
+    assert fold("a\u017fics") == "asics"
@@ -0,0 +1,68 @@
+"""Tests for the optional Hyperscan detector prefilter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from reddit_sentiment.detection import prefilter
+from reddit_sentiment.detection.patterns import fold
+from reddit_sentiment.detection.prefilter import DetectorPrefilter, _loosen, load_prefilter
+
+
+class _StubDatabase:
+    """Stands in for ``hyperscan.Database``: reports the expressions named in *hits*."""
+
+    def __init__(self, hits: dict[str, list[int]]) -> None:
+        self._hits = hits
+        self.scanned: list[bytes] = []
+
+    def scan(self, data: bytes, match_event_handler) -> None:
+        self.scanned.append(data)
+        for expr_id in self._hits.get(data.decode(), []):
+            match_event_handler(expr_id, 0, len(data), 0, None)
+
+
+def _stub_prefilter(hits: dict[str, list[int]]) -> DetectorPrefilter:
+    stub = DetectorPrefilter.__new__(DetectorPrefilter)
+    stub._classes = ["brands", "brands", "models", "channels", "intent"]
+    stub._db = _StubDatabase(hits)
+    return stub
+
+
+def test_loosen_drops_boundaries_and_gap_bounds():
+    assert _loosen(r"\bpulled\b.{0,20}\bpair\b") == "pulled.*pair"
+    assert _loosen(r"\bpaid\s+\$[\d,]+") == r"paid\s+\$[\d,]+"
+
+
+def test_load_prefilter_without_hyperscan():
+    load_prefilter.cache_clear()
+    with patch.object(prefilter, "hyperscan", None):
+        assert load_prefilter() is None
+        load_prefilter.cache_clear()
+        with pytest.raises(ImportError, match="hyperscan"):
+            prefilter.DetectorPrefilter()
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Just copped Air Jordan 1s on StockX", {"brands", "models", "channels", "intent"}),
+        ("nothing to see here", set()),
+        ("WTS my NIKE pair", {"brands", "intent"}),
+    ],
+)
+def test_prefilter_classes(text, expected):
+    pytest.importorskip("hyperscan")
+    assert load_prefilter().scan(fold(text)) == expected
+
+
+def test_scan_maps_expression_ids_to_classes():
+    stub = _stub_prefilter({"nike on stockx": [0, 1, 3]})
+    assert stub.scan("nike on stockx") == {"brands", "channels"}
+    assert stub.scan("nothing") == set()
+
+
+def test_scan_runs_every_detector_on_unencodable_text():
+    stub = _stub_prefilter({})
+    assert stub.scan("nike \ud83d pair") == {"brands", "models", "channels", "intent"}
+    assert stub._db.scanned == []
@@ -1,18 +1,22 @@
 """Tests for Plotly chart functions."""
 
-import json
-
+import numpy as np
+import orjson
 import pandas as pd
 
 from reddit_sentiment.analysis.brand_comparison import BrandMetrics
 from reddit_sentiment.analysis.channel_attribution import (
     ChannelAttribution,
 )
+from reddit_sentiment.analysis.price_correlation import ModelSignal
 from reddit_sentiment.reporting.charts import (
+    _colour,
     brand_sentiment_bar,
     channel_share_pie,
     intent_funnel,
+    model_mentions_bar,
     sentiment_distribution_pie,
+    sentiment_price_scatter,
     sentiment_trend_line,
 )
 
@@ -37,11 +41,19 @@ def _sample_attribution():
 def test_brand_bar_returns_valid_json():
     metrics = _sample_metrics()
     result = brand_sentiment_bar(metrics)
-    parsed = json.loads(result)
+    parsed = orjson.loads(result)
     assert "data" in parsed
     assert len(parsed["data"]) > 0
 
 
+def test_brand_bar_cached_for_equal_inputs():
+    first = brand_sentiment_bar(_sample_metrics())
+    assert brand_sentiment_bar(_sample_metrics()) is first
+    changed = _sample_metrics()
+    changed["Nike"].avg_hybrid_score = 0.9
+    assert brand_sentiment_bar(changed) != first
+
+
 def test_brand_bar_empty():
     result = brand_sentiment_bar({})
     assert result == "{}"
@@ -49,13 +61,13 @@ def test_brand_bar_empty():
 
 def test_sentiment_pie_returns_valid_json():
     result = sentiment_distribution_pie(_sample_metrics())
-    parsed = json.loads(result)
+    parsed = orjson.loads(result)
     assert "data" in parsed
 
 
 def test_channel_pie_returns_valid_json():
     result = channel_share_pie(_sample_attribution())
-    parsed = json.loads(result)
+    parsed = orjson.loads(result)
     assert "data" in parsed
 
 
@@ -66,7 +78,7 @@ def test_channel_pie_empty():
 
 def test_funnel_returns_valid_json():
     result = intent_funnel(_sample_attribution())
-    parsed = json.loads(result)
+    parsed = orjson.loads(result)
     assert "data" in parsed
 
 
@@ -84,5 +96,55 @@ def test_trend_line_returns_json():
         }
     )
     result = sentiment_trend_line(df)
-    parsed = json.loads(result)
+    parsed = orjson.loads(result)
     assert "data" in parsed
+
+
+def _sample_signals():
+    return [
+        ModelSignal(
+            "Dunk Low",
+            "Nike",
+            110.0,
+            mention_count=12,
+            avg_sentiment=0.3,
+            num_sales=4,
+            price_premium=0.2,
+        ),
+        ModelSignal(
+            "Samba",
+            "Adidas",
+            100.0,
+            mention_count=5,
+            avg_sentiment=-0.2,
+            num_sales=2,
+            price_premium=-0.1,
+        ),
+        ModelSignal(
+            "NB 990",
+            "New Balance",
+            185.0,
+            mention_count=5,
+            avg_sentiment=0.0,
+            num_sales=1,
+            price_premium=0.05,
+        ),
+        ModelSignal("Rare", "Puma", 100.0, mention_count=1, avg_sentiment=0.9),
+    ]
+
+
+def test_model_bar_sorted_and_coloured_by_sentiment():
+    bar = orjson.loads(model_mentions_bar(_sample_signals()))["data"][0]
+    assert bar["y"] == ["Samba", "NB 990", "Dunk Low"]
+    assert bar["x"] == [5, 5, 12]
+    assert bar["marker"]["color"] == ["#ef4444", "#94a3b8", "#22c55e"]
+
+
+def test_price_scatter_bubble_sizes_clipped():
+    marker = orjson.loads(sentiment_price_scatter(_sample_signals()))["data"][0]["marker"]
+    assert marker["size"] == [18.0, 8.0, 8.0]
+
+
+def test_colour_thresholds_are_exclusive():
+    scores = np.array([0.06, 0.05, 0.0, -0.05, -0.06, np.nan])
+    assert _colour(scores) == ["#22c55e", "#94a3b8", "#94a3b8", "#94a3b8", "#ef4444", "#94a3b8"]
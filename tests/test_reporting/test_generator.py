@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pandas as pd
+import pytest
+from jinja2 import Environment
 
 from reddit_sentiment.reporting.generator import ReportGenerator
 
@@ -12,37 +15,60 @@ from reddit_sentiment.reporting.generator import ReportGenerator
 def _make_annotated_df() -> pd.DataFrame:
     """Synthetic annotated DataFrame that resembles pipeline output."""
     now = datetime(2024, 3, 15, tzinfo=UTC)
-    rows = []
     brands_cycle = [["Nike"], ["Adidas"], ["New Balance"], ["Nike", "Adidas"], []]
     channels_cycle = [["StockX"], ["GOAT"], [], ["Foot Locker"], []]
     intents = ["completed_purchase", "seeking_purchase", "price_discussion", None, None]
     scores = [0.7, -0.3, 0.1, 0.5, -0.1]
 
-    for i in range(20):
-        rows.append(
-            {
-                "id": f"post_{i}",
-                "subreddit": "Sneakers" if i % 2 == 0 else "Nike",
-                "full_text": f"Sample text about sneakers {i}",
-                "record_type": "post" if i < 10 else "comment",
-                "created_utc": now,
-                "score": 100 - i * 3,
-                "vader_score": scores[i % 5],
-                "hybrid_score": scores[i % 5],
-                "transformer_score": None,
-                "brands": brands_cycle[i % 5],
-                "channels": channels_cycle[i % 5],
-                "primary_intent": intents[i % 5],
-                "all_intents": [intents[i % 5]] if intents[i % 5] else [],
-            }
-        )
-    return pd.DataFrame(rows)
+    n = 20
+    cycle = [i % 5 for i in range(n)]
+    return pd.DataFrame(
+        {
+            "id": [f"post_{i}" for i in range(n)],
+            "subreddit": ["Sneakers" if i % 2 == 0 else "Nike" for i in range(n)],
+            "full_text": [f"Sample text about sneakers {i}" for i in range(n)],
+            "record_type": ["post" if i < 10 else "comment" for i in range(n)],
+            "created_utc": [now] * n,
+            "score": [100 - i * 3 for i in range(n)],
+            "vader_score": [scores[c] for c in cycle],
+            "hybrid_score": [scores[c] for c in cycle],
+            "transformer_score": [None] * n,
+            "brands": [brands_cycle[c] for c in cycle],
+            "channels": [channels_cycle[c] for c in cycle],
+            "primary_intent": [intents[c] for c in cycle],
+            "all_intents": [[intents[c]] if intents[c] else [] for c in cycle],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def annotated_df() -> pd.DataFrame:
+    # generate() leaves its input untouched, so one frame serves the module
+    return _make_annotated_df()
+
+
+@pytest.fixture(scope="module")
+def reports_dir(tmp_path_factory):
+    # One output dir for the module; each test writes under its own timestamp
+    return tmp_path_factory.mktemp("reports")
+
+
+@pytest.fixture(scope="module")
+def empty_raw_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("raw")
+
+
+@pytest.fixture(autouse=True)
+def no_ebay_data(empty_raw_dir, monkeypatch):
+    """Keep generate() off any real eBay parquet in the configured raw dir."""
+    from reddit_sentiment.config import collection_config
 
+    monkeypatch.setattr(collection_config, "raw_data_dir", empty_raw_dir)
 
-def test_generate_creates_html(tmp_path):
-    df = _make_annotated_df()
-    gen = ReportGenerator(reports_dir=tmp_path)
-    html_path, md_path = gen.generate(df, timestamp="20240315_120000")
+
+def test_generate_creates_html(reports_dir, annotated_df):
+    gen = ReportGenerator(reports_dir=reports_dir)
+    html_path, md_path = gen.generate(annotated_df, timestamp="20240315_120000")
 
     assert html_path.exists()
     assert md_path.exists()
@@ -53,10 +79,9 @@ def test_generate_creates_html(tmp_path):
     assert "Plotly" in html_content or "plotly" in html_content
 
 
-def test_generate_markdown_contains_brand_table(tmp_path):
-    df = _make_annotated_df()
-    gen = ReportGenerator(reports_dir=tmp_path)
-    _, md_path = gen.generate(df, timestamp="20240315_120001")
+def test_generate_markdown_contains_brand_table(reports_dir, annotated_df):
+    gen = ReportGenerator(reports_dir=reports_dir)
+    _, md_path = gen.generate(annotated_df, timestamp="20240315_120001")
 
     md_content = md_path.read_text(encoding="utf-8")
     assert "## Brand Rankings" in md_content
@@ -64,7 +89,23 @@ def test_generate_markdown_contains_brand_table(tmp_path):
     assert "## Purchase Intent" in md_content
 
 
-def test_generate_empty_df(tmp_path):
+def test_template_loaded_once(reports_dir, annotated_df):
+    gen = ReportGenerator(reports_dir=reports_dir)
+    # generate() renders the template compiled in __init__; no further lookups
+    with patch.object(gen._jinja, "get_template", side_effect=AssertionError):
+        html_path, _ = gen.generate(annotated_df, timestamp="20240315_120002")
+    assert html_path.exists()
+
+
+def test_template_bytecode_reused_across_generators(reports_dir):
+    ReportGenerator(reports_dir=reports_dir)
+    # A fresh environment loads the compiled template from the bytecode cache
+    with patch.object(Environment, "_parse", side_effect=AssertionError):
+        gen = ReportGenerator(reports_dir=reports_dir)
+    assert gen._template is not None
+
+
+def test_generate_empty_df(reports_dir):
     """Should not crash on an empty DataFrame."""
     df = pd.DataFrame(
         columns=[
@@ -83,7 +124,58 @@ def test_generate_empty_df(tmp_path):
             "all_intents",
         ]
     )
-    gen = ReportGenerator(reports_dir=tmp_path)
+    gen = ReportGenerator(reports_dir=reports_dir)
     # Should complete without raising
-    html_path, md_path = gen.generate(df, timestamp="20240315_120002")
+    html_path, md_path = gen.generate(df, timestamp="20240315_120003")
     assert html_path.exists()
+
+
+def test_load_ebay_arrow_projects_analyzer_columns(tmp_path, monkeypatch):
+    from reddit_sentiment.config import collection_config
+
+    monkeypatch.setattr(collection_config, "raw_data_dir", tmp_path)
+    pd.DataFrame(
+        {
+            "model": ["Air Jordan 1", "Samba"],
+            "sold_price_usd": [210.0, 95.5],
+            "title": ["AJ1 Chicago", "Samba OG"],
+            "item_url": ["https://ebay.com/1", "https://ebay.com/2"],
+        }
+    ).to_parquet(tmp_path / "ebay_20240315.parquet")
+
+    table = ReportGenerator(reports_dir=tmp_path / "reports")._load_ebay_arrow()
+    assert table.column_names == ["model", "sold_price_usd"]
+    assert table.column("sold_price_usd").to_pylist() == [210.0, 95.5]
+
+    # The pandas fallback is the same projection
+    ebay_df = ReportGenerator(reports_dir=tmp_path / "reports")._load_ebay_data()
+    assert list(ebay_df.columns) == ["model", "sold_price_usd"]
+
+
+def test_load_ebay_arrow_empty_without_files(tmp_path, monkeypatch):
+    from reddit_sentiment.config import collection_config
+
+    monkeypatch.setattr(collection_config, "raw_data_dir", tmp_path)
+    table = ReportGenerator(reports_dir=tmp_path / "reports")._load_ebay_arrow()
+    assert table.num_rows == 0
+
+
+def test_brand_rows_prerendered_and_escaped():
+    rows = ReportGenerator._render_brand_rows(
+        pd.DataFrame(
+            [
+                {
+                    "brand": "A&B <Co>",
+                    "mentions": 7,
+                    "avg_sentiment": 0.12345,
+                    "sentiment": "Positive",
+                    "positive_%": 57.14,
+                    "negative_%": 14.29,
+                    "neutral_%": 28.57,
+                }
+            ]
+        )
+    )
+    assert "<strong>A&amp;B &lt;Co&gt;</strong>" in rows
+    assert '<td class="positive">Positive</td>' in rows
+    assert "<td>0.1235</td>" in rows and "<td>57.1%</td>" in rows
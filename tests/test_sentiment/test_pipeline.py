@@ -11,8 +11,10 @@ from reddit_sentiment.sentiment.pipeline import SentimentPipeline
 
 
 def _make_df(rows: list[dict]) -> pd.DataFrame:
+    # Column-wise: one list per field, extracted_urls defaulting to no links
+    keys = dict.fromkeys(["extracted_urls", *(k for r in rows for k in r)])
     defaults = {"extracted_urls": []}
-    return pd.DataFrame([{**defaults, **r} for r in rows])
+    return pd.DataFrame({k: [r.get(k, defaults.get(k)) for r in rows] for k in keys})
 
 
 @pytest.fixture
@@ -107,3 +109,95 @@ def test_multi_row_annotation(pipeline_no_transformer):
     out = pipeline_no_transformer.annotate(df)
     assert len(out) == 3
     assert list(out["id"]) == ["1", "2", "3"]
+
+
+def test_annotate_leaves_input_unchanged(pipeline_no_transformer):
+    df = _make_df([{"id": "1", "full_text": "Nike rules"}])
+    pipeline_no_transformer.annotate(df)
+    assert list(df.columns) == ["extracted_urls", "id", "full_text"]
+
+
+@patch("reddit_sentiment.sentiment.pipeline.SentimentPipeline._get_transformer")
+def test_zero_transformer_weight_skips_transformer(mock_get_transformer, monkeypatch):
+    monkeypatch.setenv("TRANSFORMER_WEIGHT", "0")
+    pl = SentimentPipeline(use_transformer=True)
+    out = pl.annotate(_make_df([{"id": "1", "full_text": "Nike is absolutely incredible"}]))
+    mock_get_transformer.assert_not_called()
+    assert out["transformer_score"].iloc[0] is None
+    assert out["hybrid_score"].iloc[0] == out["vader_score"].iloc[0]
+
+
+@patch("reddit_sentiment.sentiment.pipeline.SentimentPipeline._get_transformer")
+def test_extreme_vader_skips_transformer(mock_get_transformer, monkeypatch):
+    monkeypatch.setenv("TRANSFORMER_SKIP_VADER_ABS", "0.8")
+    mock_get_transformer.return_value.score_batch.return_value = [0.5]
+    pl = SentimentPipeline(use_transformer=True)
+    df = _make_df(
+        [
+            {"id": "1", "full_text": "Nike is incredible, I love them, best shoes ever!"},
+            {"id": "2", "full_text": "Adidas restock is today"},
+        ]
+    )
+    out = pl.annotate(df)
+
+    # Only the neutral row's context reaches the model
+    (contexts,), _ = mock_get_transformer.return_value.score_batch.call_args
+    assert len(contexts) == 1 and "Adidas" in contexts[0]
+    assert out["hybrid_score"].iloc[0] == out["vader_score"].iloc[0]
+    assert out["transformer_score"].iloc[1] == 0.5
+
+
+def _parallel_df() -> pd.DataFrame:
+    texts = ["Nike rules", "Adidas is terrible", "Copped on StockX"] * 400
+    return _make_df([{"id": str(i), "full_text": text} for i, text in enumerate(texts)])
+
+
+def test_annotate_parallel_matches_serial(pipeline_no_transformer):
+    df = _parallel_df()
+    parallel = pipeline_no_transformer.annotate_parallel(df, n_jobs=2)
+    pd.testing.assert_frame_equal(parallel, pipeline_no_transformer.annotate(df))
+
+
+def test_annotate_parallel_transformer_fallback_matches_serial():
+    from reddit_sentiment.sentiment.transformer import _check_ml
+
+    if _check_ml():
+        pytest.skip("the VADER fallback only runs without torch/transformers")
+    df = _parallel_df()
+    with SentimentPipeline(use_transformer=True) as pl:
+        pd.testing.assert_frame_equal(pl.annotate_parallel(df, n_jobs=2), pl.annotate(df))
+
+
+@patch(
+    "reddit_sentiment.sentiment.pipeline.SentimentPipeline._get_transformer",
+    side_effect=ImportError,
+)
+def test_transformer_fallback_respects_vader_jobs(_mock_get_transformer):
+    pl = SentimentPipeline(use_transformer=True, vader_jobs=1)
+    with patch.object(pl._vader, "score_batch", wraps=pl._vader.score_batch) as score_batch:
+        out = pl.annotate(_make_df([{"id": "1", "full_text": "Nike is absolutely incredible"}]))
+    # Texts, then the brand contexts: both batches stay in-process
+    assert [c.args[1] for c in score_batch.call_args_list] == [1, 1]
+    assert out["transformer_score"].iloc[0] is None
+
+
+def test_context_manager_closes_vader_pool(pipeline_no_transformer):
+    with patch.object(pipeline_no_transformer._vader, "close") as close:
+        with pipeline_no_transformer as pl:
+            pl.annotate(_make_df([{"id": "1", "full_text": "Nike rules"}]))
+    close.assert_called_once_with()
+
+
+def test_prefilter_skips_detectors_it_rules_out(pipeline_no_transformer):
+    pl = pipeline_no_transformer
+    pl._prefilter = MagicMock()
+    pl._prefilter.scan.return_value = {"channels"}
+    out = pl.annotate(_make_df([{"id": "1", "full_text": "Just copped Nike Dunks on StockX"}]))
+    assert out["brands"].iloc[0] == []
+    assert out["channels"].iloc[0] == ["StockX"]
+    assert out["primary_intent"].iloc[0] is None
+    # Without the prefilter every detector runs
+    pl._prefilter = None
+    out = pl.annotate(_make_df([{"id": "1", "full_text": "Just copped Nike Dunks on StockX"}]))
+    assert out["brands"].iloc[0] == ["Nike"]
+    assert out["primary_intent"].iloc[0] is not None
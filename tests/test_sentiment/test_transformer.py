@@ -2,20 +2,18 @@
 
 from __future__ import annotations
 
+import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from reddit_sentiment.sentiment.transformer import TransformerAnalyzer
-
-
-def _make_pipeline_output(pos: float = 0.7, neg: float = 0.1, neu: float = 0.2):
-    """Simulate HuggingFace pipeline output format."""
-    return [
-        {"label": "positive", "score": pos},
-        {"label": "negative", "score": neg},
-        {"label": "neutral", "score": neu},
-    ]
+from reddit_sentiment.sentiment.transformer import (
+    TransformerAnalyzer,
+    _label_indices,
+    _load_onnx_int8,
+    _load_weights,
+)
 
 
 @pytest.fixture
@@ -23,29 +21,37 @@ def analyzer():
     return TransformerAnalyzer(model_name="mock-model")
 
 
-def test_labels_to_score_positive(analyzer):
-    labels = _make_pipeline_output(pos=0.8, neg=0.1)
-    score = analyzer._labels_to_score(labels)
-    assert abs(score - 0.7) < 1e-6
+def _preload(analyzer, chunk_scores):
+    """Bypass _load() and stub the model batch with *chunk_scores* (text → score)."""
+    analyzer._model = MagicMock()
+    analyzer._score_chunk = MagicMock(side_effect=lambda ts: [chunk_scores(t) for t in ts])
+
+
+def test_label_indices_named_labels():
+    assert _label_indices({0: "negative", 1: "neutral", 2: "positive"}) == (2, 0)
+
 
+def test_label_indices_reordered_labels():
+    assert _label_indices({0: "Positive", 1: "Negative", 2: "Neutral"}) == (0, 1)
 
-def test_labels_to_score_negative(analyzer):
-    labels = _make_pipeline_output(pos=0.1, neg=0.8)
-    score = analyzer._labels_to_score(labels)
-    assert abs(score - (-0.7)) < 1e-6
 
+def test_label_indices_generic_labels():
+    assert _label_indices({0: "LABEL_0", 1: "LABEL_1", 2: "LABEL_2"}) == (2, 0)
 
-def test_labels_to_score_neutral(analyzer):
-    labels = _make_pipeline_output(pos=0.33, neg=0.33)
-    score = analyzer._labels_to_score(labels)
-    assert abs(score) < 0.01
+
+def test_label_indices_binary_generic_labels():
+    # LABEL_1 of a two-class checkpoint is not "positive"; it counts as neutral
+    assert _label_indices({0: "LABEL_0", 1: "LABEL_1"}) == (None, 0)
+
+
+def test_label_indices_unrelated_labels():
+    stars = {i: f"{i + 1} stars" for i in range(5)}
+    assert _label_indices(stars) == (None, None)
 
 
 def test_score_returns_float(analyzer):
-    """score() returns a float in [-1, 1] when _pipeline is pre-loaded."""
-    mock_pipe = MagicMock()
-    mock_pipe.return_value = [_make_pipeline_output(pos=0.9, neg=0.05)]
-    analyzer._pipeline = mock_pipe  # bypass _load()
+    """score() returns a float in [-1, 1] when the model is pre-loaded."""
+    _preload(analyzer, lambda t: 0.85)
 
     score = analyzer.score("These shoes are fantastic!")
     assert isinstance(score, float)
@@ -59,12 +65,7 @@ def test_score_empty_returns_zero(analyzer):
 
 
 def test_score_batch_preserves_length(analyzer):
-    mock_pipe = MagicMock()
-    mock_pipe.return_value = [
-        _make_pipeline_output(pos=0.8, neg=0.1),
-        _make_pipeline_output(pos=0.1, neg=0.8),
-    ]
-    analyzer._pipeline = mock_pipe  # bypass _load()
+    _preload(analyzer, lambda t: 0.7 if t == "great!" else -0.7)
 
     texts = ["great!", "terrible"]
     scores = analyzer.score_batch(texts)
@@ -73,9 +74,126 @@ def test_score_batch_preserves_length(analyzer):
     assert scores[1] < 0
 
 
+def test_score_batch_maps_batches_back_to_input_order(analyzer):
+    analyzer._batch_size = 2
+    _preload(analyzer, lambda t: len(t) / 10)
+
+    texts = ["aaaa", "", "a", "aaa", "  ", "aa"]
+    assert analyzer.score_batch(texts) == [0.4, 0.0, 0.1, 0.3, 0.0, 0.2]
+    # Empties skipped; the rest run in length-sorted batches of two
+    batches = [call.args[0] for call in analyzer._score_chunk.call_args_list]
+    assert batches == [["a", "aa"], ["aaa", "aaaa"]]
+
+
+def test_score_batch_respects_batch_size(analyzer):
+    _preload(analyzer, lambda t: 0.5)
+
+    analyzer.score_batch(["a", "bb", "ccc", "dddd", "eeeee"], batch_size=2)
+    sizes = [len(call.args[0]) for call in analyzer._score_chunk.call_args_list]
+    assert sizes == [2, 2, 1]
+
+
 def test_import_error_without_ml():
     """TransformerAnalyzer should raise ImportError if torch missing."""
     analyzer = TransformerAnalyzer(model_name="mock-model")
     with patch("reddit_sentiment.sentiment.transformer._check_ml", return_value=False):
         with pytest.raises(ImportError, match="torch and transformers"):
             analyzer._load()
+
+
+def test_onnx_flag_read_from_environment(monkeypatch):
+    monkeypatch.setenv("SENTIMENT_USE_ONNX", "true")
+    analyzer = TransformerAnalyzer(model_name="org/mock-model")
+    assert analyzer._use_onnx is True
+    assert analyzer._onnx_dir.name == "org--mock-model"
+
+
+def test_onnx_import_error_without_optimum(tmp_path):
+    with patch.dict(sys.modules, {"optimum": None, "optimum.onnxruntime": None}):
+        with pytest.raises(ImportError, match="optimum"):
+            _load_onnx_int8("mock-model", tmp_path)
+
+
+def test_analyzers_share_loaded_weights():
+    weights = (MagicMock(), MagicMock(), "cpu", 2, 0)
+    with (
+        patch("reddit_sentiment.sentiment.transformer._check_ml", return_value=True),
+        patch("reddit_sentiment.sentiment.transformer._load_weights", return_value=weights) as load,
+    ):
+        first, second = TransformerAnalyzer("mock-model"), TransformerAnalyzer("mock-model")
+        first._load()
+        second._load()
+    assert first._model is second._model is weights[1]
+    assert load.call_args_list[0] == load.call_args_list[1]
+
+
+# Class probabilities per text length, for the fake model below
+_PROBS = {1: [0.1, 0.2, 0.7], 2: [0.6, 0.3, 0.1], 3: [0.25, 0.5, 0.25]}
+
+
+class _FakeEncoding(dict):
+    def to(self, device):
+        return self
+
+
+class _FakeTokenizer:
+    """Encodes each text as a single token: its length."""
+
+    def __call__(self, texts, **kwargs):
+        import torch
+
+        return _FakeEncoding(input_ids=torch.tensor([[len(t)] for t in texts]))
+
+
+class _FakeModel:
+    """One logit per label; their softmax is ``_PROBS[len(text)]``, renormalized."""
+
+    def __init__(self, id2label) -> None:
+        self.config = SimpleNamespace(id2label=id2label)
+
+    def to(self, device):
+        return self
+
+    def eval(self):
+        return self
+
+    def __call__(self, input_ids):
+        import torch
+
+        probs = torch.tensor([_PROBS[int(n)] for n in input_ids[:, 0]])
+        return SimpleNamespace(logits=probs[:, : len(self.config.id2label)].log())
+
+
+@pytest.fixture
+def fresh_weights():
+    _load_weights.cache_clear()
+    yield
+    _load_weights.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("id2label", "expected"),
+    [
+        # P(positive) - P(negative), with the labels out of the default order
+        ({0: "positive", 1: "neutral", 2: "negative"}, [0.5, 0.0, -0.6, 0.0]),
+        ({0: "LABEL_0", 1: "LABEL_1", 2: "LABEL_2"}, [-0.5, 0.0, 0.6, 0.0]),
+        # Binary checkpoint: no positive label, so only P(LABEL_0) counts
+        ({0: "LABEL_0", 1: "LABEL_1"}, [-2 / 3, 0.0, -1 / 3, -1 / 3]),
+        ({0: "1 star", 1: "2 stars", 2: "3 stars"}, [0.0, 0.0, 0.0, 0.0]),
+    ],
+)
+def test_score_batch_runs_model_batches(fresh_weights, id2label, expected):
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    with (
+        patch("transformers.AutoTokenizer.from_pretrained", return_value=_FakeTokenizer()),
+        patch(
+            "transformers.AutoModelForSequenceClassification.from_pretrained",
+            return_value=_FakeModel(id2label),
+        ),
+        patch.object(torch.cuda, "is_available", return_value=False),
+    ):
+        analyzer = TransformerAnalyzer(model_name="fake-model")
+        # Two batches: the non-empties run as ["a", "bb"] then ["ccc"]
+        scores = analyzer.score_batch(["bb", "  ", "a", "ccc"], batch_size=2)
+    assert scores == pytest.approx(expected)
@@ -1,13 +1,16 @@
 """Tests for VaderAnalyzer."""
 
+import gc
+
 import pytest
 
-from reddit_sentiment.sentiment.vader import VaderAnalyzer
+from reddit_sentiment.sentiment.vader import VaderAnalyzer, _shared_analyzer
 
 
 @pytest.fixture
 def analyzer():
-    return VaderAnalyzer()
+    with VaderAnalyzer() as analyzer:
+        yield analyzer
 
 
 def test_positive_text(analyzer):
@@ -38,6 +41,40 @@ def test_score_batch(analyzer):
     assert scores[0] > scores[1]  # great > terrible
 
 
+def test_score_batch_parallel_matches_serial(analyzer):
+    texts = ["great!", "terrible", "ok", "", "I love these but the sizing is awful"] * 250
+    assert analyzer.score_batch(texts, n_jobs=2) == analyzer.score_batch(texts, n_jobs=1)
+
+
+def test_context_manager_shuts_down_pool():
+    with VaderAnalyzer() as analyzer:
+        analyzer.score_batch(["great!"] * 1000, n_jobs=2)
+        assert analyzer._pool is not None
+    assert analyzer._pool is None
+
+
+def test_default_batch_runs_in_process(analyzer):
+    analyzer.score_batch(["great!"] * 1000)
+    assert analyzer._pool is None
+
+
+def test_dropped_analyzer_shuts_down_pool():
+    analyzer = VaderAnalyzer()
+    analyzer.score_batch(["great!"] * 1000, n_jobs=2)
+    pool = analyzer._pool
+    del analyzer
+    gc.collect()
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+
+
+def test_analyzers_share_lexicon(analyzer):
+    analyzer.score("great!")
+    loads = _shared_analyzer.cache_info().misses
+    VaderAnalyzer().full_scores("a sentence no other test scores")
+    assert _shared_analyzer.cache_info().misses == loads
+
+
 def test_full_scores_keys(analyzer):
     scores = analyzer.full_scores("I love this!")
     assert set(scores.keys()) == {"neg", "neu", "pos", "compound"}
@@ -47,3 +84,17 @@ def test_full_scores_empty(analyzer):
     scores = analyzer.full_scores("")
     assert scores["compound"] == 0.0
     assert scores["neu"] == 1.0
+
+
+def test_repeated_text_scored_once(analyzer):
+    from reddit_sentiment.sentiment.vader import _polarity_scores
+
+    _polarity_scores.cache_clear()
+    analyzer.score_batch(["great!", "great!", "terrible", "great!"], n_jobs=1)
+    info = _polarity_scores.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def test_full_scores_returns_a_copy(analyzer):
+    analyzer.full_scores("I love this!")["compound"] = 99.0
+    assert analyzer.full_scores("I love this!")["compound"] < 1.0